@@ -12,6 +12,7 @@ import typing
 from dataclasses import dataclass
 
 import terminaltexteffects.utils.argvalidators as argvalidators
+from terminaltexteffects.engine import animation
 from terminaltexteffects.engine.base_character import EffectCharacter, EventHandler
 from terminaltexteffects.engine.base_effect import BaseEffect, BaseEffectIterator
 from terminaltexteffects.utils import geometry
@@ -183,13 +184,16 @@ class ColorShiftIterator(BaseEffectIterator[ColorShiftConfig]):
         self.loop_tracker_map: dict[EffectCharacter, int] = {}
         self.build()
 
-    def loop_tracker(self, character: EffectCharacter) -> None:
-        self.loop_tracker_map[character] = self.loop_tracker_map.get(character, 0) + 1
-        if self.config.cycles == 0 or (self.loop_tracker_map[character] < self.config.cycles):
-            character.animation.activate_scene(character.animation.query_scene("gradient"))
+    def loop_tracker(
+        self, character: EffectCharacter, gradient_scn: animation.Scene, final_gradient_scn: animation.Scene
+    ) -> None:
+        loop_count = self.loop_tracker_map.get(character, 0) + 1
+        self.loop_tracker_map[character] = loop_count
+        if self.config.cycles == 0 or (loop_count < self.config.cycles):
+            character.animation.activate_scene(gradient_scn)
         else:
             if not self.config.skip_final_gradient:
-                character.animation.activate_scene(character.animation.query_scene("final_gradient"))
+                character.animation.activate_scene(final_gradient_scn)
 
     def build(self) -> None:
         final_gradient = Gradient(*self.config.final_gradient_stops, steps=self.config.final_gradient_steps)
@@ -201,40 +205,68 @@ class ColorShiftIterator(BaseEffectIterator[ColorShiftConfig]):
         gradient = Gradient(
             *self.config.gradient_stops, steps=self.config.gradient_steps, loop=self.config.loop_gradient
         )
-        for character in self.terminal.get_characters():
-            self.terminal.set_character_visibility(character, True)
-            gradient_scn = character.animation.new_scene(id="gradient")
-            if self.config.travel:
-                if self.config.travel_direction == Gradient.Direction.HORIZONTAL:
-                    direction_index = character.input_coord.column / self.terminal.canvas.right
-                elif self.config.travel_direction == Gradient.Direction.VERTICAL:
-                    direction_index = character.input_coord.row / self.terminal.canvas.top
-                elif self.config.travel_direction == Gradient.Direction.DIAGONAL:
-                    direction_index = (character.input_coord.row + character.input_coord.column) / (
-                        self.terminal.canvas.right + self.terminal.canvas.top
-                    )
-                elif self.config.travel_direction == Gradient.Direction.RADIAL:
-                    direction_index = geometry.find_normalized_distance_from_center(
-                        self.terminal.canvas.top, self.terminal.canvas.right, character.input_coord
+        # every rotation of the spectrum is a contiguous slice of the spectrum repeated twice
+        spectrum_length = len(gradient.spectrum)
+        repeated_spectrum = gradient.spectrum * 2
+        # characters with the same rotation share a single color list
+        rotated_colors: dict[int, list[Color]] = {}
+        # values read for every character are bound once outside of the loop
+        canvas_top = self.terminal.canvas.top
+        canvas_right = self.terminal.canvas.right
+        gradient_frames = self.config.gradient_frames
+        travel = self.config.travel
+        travel_direction = self.config.travel_direction
+        reverse_travel_direction = self.config.reverse_travel_direction
+        set_character_visibility = self.terminal.set_character_visibility
+        # the travel direction is fixed for the whole build, so the shift distance calculation is selected once.
+        # the linear directions use integer floor division, avoiding a float division and multiplication per character
+        diagonal_length = canvas_right + canvas_top
+        shift_distance_by_travel_direction: dict[Gradient.Direction, typing.Callable[[geometry.Coord], int]] = {
+            Gradient.Direction.HORIZONTAL: lambda coord: spectrum_length * coord.column // canvas_right,
+            Gradient.Direction.VERTICAL: lambda coord: spectrum_length * coord.row // canvas_top,
+            Gradient.Direction.DIAGONAL: lambda coord: spectrum_length * (coord.row + coord.column) // diagonal_length,
+        }
+        characters = self.terminal.get_characters()
+        if travel:
+            # the spectrum rotation for every character is computed in a single pass ahead of building the scenes
+            if travel_direction == Gradient.Direction.RADIAL:
+                shift_distances = [
+                    int(spectrum_length * distance)
+                    for distance in geometry.find_normalized_distances_from_center(
+                        canvas_top, canvas_right, [character.input_coord for character in characters]
                     )
-                shift_distance = int(len(gradient.spectrum) * direction_index)
-                if self.config.reverse_travel_direction:
-                    shift_distance = shift_distance * -1
-                colors = gradient.spectrum[shift_distance:] + gradient.spectrum[:shift_distance]
+                ]
+            else:
+                find_shift_distance = shift_distance_by_travel_direction[travel_direction]
+                shift_distances = [find_shift_distance(character.input_coord) for character in characters]
+            shift_sign = -1 if reverse_travel_direction else 1
+            rotation_starts = [(shift_sign * shift_distance) % spectrum_length for shift_distance in shift_distances]
+        else:
+            rotation_starts = [0] * len(characters)
+        for character, rotation_start in zip(characters, rotation_starts):
+            set_character_visibility(character, True)
+            input_symbol = character.input_symbol
+            gradient_scn = character.animation.new_scene(id="gradient")
+            if travel:
+                if rotation_start not in rotated_colors:
+                    rotated_colors[rotation_start] = repeated_spectrum[
+                        rotation_start : rotation_start + spectrum_length
+                    ]
+                colors = rotated_colors[rotation_start]
             else:
                 colors = gradient.spectrum
             for color in colors:
-                gradient_scn.add_frame(character.input_symbol, self.config.gradient_frames, color=color)
+                gradient_scn.add_frame(input_symbol, gradient_frames, color=color)
             final_color_scn = character.animation.new_scene(id="final_gradient")
             for color in Gradient(colors[-1], self.character_final_color_map[character], steps=8):
-                final_color_scn.add_frame(character.input_symbol, self.config.gradient_frames, color=color)
+                final_color_scn.add_frame(input_symbol, gradient_frames, color=color)
             character.animation.activate_scene(gradient_scn)
             self.active_characters.append(character)
             character.event_handler.register_event(
                 EventHandler.Event.SCENE_COMPLETE,
                 gradient_scn,
                 EventHandler.Action.CALLBACK,
-                EventHandler.Callback(self.loop_tracker),
+                EventHandler.Callback(self.loop_tracker, gradient_scn, final_color_scn),
             )
 
     def __next__(self) -> str:
@@ -8,8 +8,10 @@ Classes:
 
 from __future__ import annotations
 
+import itertools
 import random
 import typing
+from collections import deque
 from dataclasses import dataclass
 
 from terminaltexteffects.engine import animation
@@ -19,6 +21,13 @@ from terminaltexteffects.utils import argvalidators
 from terminaltexteffects.utils.argsdataclass import ArgField, ArgsDataClass, argclass
 from terminaltexteffects.utils.graphics import Color, Gradient
 
+# keyboard, block, box drawing and miscellaneous symbols used for the ciphertext
+_ENCRYPTED_SYMBOLS: tuple[str, ...] = tuple(
+    map(chr, itertools.chain(range(33, 127), range(9608, 9632), range(9472, 9599), range(174, 452)))
+)
+# block symbols shown in sequence as each character is typed
+_TYPING_SYMBOLS: tuple[str, ...] = ("▉", "▓", "▒", "░")
+
 
 def get_effect_and_args() -> tuple[type[typing.Any], type[ArgsDataClass]]:
     return Decrypt, DecryptConfig
@@ -95,46 +104,28 @@ class DecryptConfig(ArgsDataClass):
 
 
 class DecryptIterator(BaseEffectIterator[DecryptConfig]):
-    @dataclass
-    class _DecryptChars:
-        keyboard = list(range(33, 127))
-        blocks = list(range(9608, 9632))
-        box_drawing = list(range(9472, 9599))
-        misc = list(range(174, 452))
-
     def __init__(self, effect: "Decrypt") -> None:
         super().__init__(effect)
         self.pending_chars: list[EffectCharacter] = []
-        self.typing_pending_chars: list[EffectCharacter] = []
+        self.typing_pending_chars: deque[EffectCharacter] = deque()
         self.decrypting_pending_chars: list[EffectCharacter] = []
         self.phase = "typing"
-        self.encrypted_symbols: list[str] = []
+        self.encrypted_symbols: tuple[str, ...] = _ENCRYPTED_SYMBOLS
         self.scenes: dict[str, animation.Scene] = {}
         self.character_final_color_map: dict[EffectCharacter, Color] = {}
-        self.make_encrypted_symbols()
         self.build()
 
-    def make_encrypted_symbols(self) -> None:
-        for n in DecryptIterator._DecryptChars.keyboard:
-            self.encrypted_symbols.append(chr(n))
-        for n in DecryptIterator._DecryptChars.blocks:
-            self.encrypted_symbols.append(chr(n))
-        for n in DecryptIterator._DecryptChars.box_drawing:
-            self.encrypted_symbols.append(chr(n))
-        for n in DecryptIterator._DecryptChars.misc:
-            self.encrypted_symbols.append(chr(n))
-
     def make_decrypting_animation_scenes(self, character: EffectCharacter) -> None:
         fast_decrypt_scene = character.animation.new_scene(id="fast_decrypt")
         color = random.choice(self.config.ciphertext_colors)
-        for _ in range(80):
-            symbol = random.choice(self.encrypted_symbols)
+        for symbol in random.choices(self.encrypted_symbols, k=80):
             fast_decrypt_scene.add_frame(symbol, 3, color=color)
-            duration = 3
         slow_decrypt_scene = character.animation.new_scene(id="slow_decrypt")
-        for _ in range(random.randint(1, 15)):  # 1-15 longer duration units
-            symbol = random.choice(self.encrypted_symbols)
-            if random.randint(0, 100) <= 30:  # 30% chance of extra long duration
+        slow_frame_count = random.randint(1, 15)  # 1-15 longer duration units
+        slow_symbols = random.choices(self.encrypted_symbols, k=slow_frame_count)
+        duration_rolls = random.choices(range(101), k=slow_frame_count)
+        for symbol, duration_roll in zip(slow_symbols, duration_rolls):
+            if duration_roll <= 30:  # 30% chance of extra long duration
                 duration = random.randrange(50, 125)  # wide long duration range reduces 'waves' in the animation
             else:
                 duration = random.randrange(5, 10)  # shorter duration creates flipping effect
@@ -144,14 +135,15 @@ class DecryptIterator(BaseEffectIterator[DecryptConfig]):
         discovered_scene.apply_gradient_to_symbols(discovered_gradient, character.input_symbol, 8)
 
     def prepare_data_for_type_effect(self) -> None:
+        ciphertext_colors = self.config.ciphertext_colors
         for character in self.terminal.get_characters():
             typing_scene = character.animation.new_scene(id="typing")
-            for block_char in ["▉", "▓", "▒", "░"]:
-                typing_scene.add_frame(block_char, 2, color=random.choice(self.config.ciphertext_colors))
+            # one color for each block symbol and one for the final ciphertext symbol
+            typing_colors = random.choices(ciphertext_colors, k=len(_TYPING_SYMBOLS) + 1)
+            for block_char, color in zip(_TYPING_SYMBOLS, typing_colors):
+                typing_scene.add_frame(block_char, 2, color=color)
 
-            typing_scene.add_frame(
-                random.choice(self.encrypted_symbols), 2, color=random.choice(self.config.ciphertext_colors)
-            )
+            typing_scene.add_frame(random.choice(self.encrypted_symbols), 2, color=typing_colors[-1])
             self.typing_pending_chars.append(character)
 
     def prepare_data_for_decrypt_effect(self) -> None:
@@ -189,7 +181,7 @@ class DecryptIterator(BaseEffectIterator[DecryptConfig]):
                     if random.randint(0, 100) <= 75:
                         for _ in range(self.config.typing_speed):
                             if self.typing_pending_chars:
-                                next_character = self.typing_pending_chars.pop(0)
+                                next_character = self.typing_pending_chars.popleft()
                                 self.terminal.set_character_visibility(next_character, True)
                                 next_character.animation.activate_scene(next_character.animation.query_scene("typing"))
                                 self.active_characters.append(next_character)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import random
 import typing
 from dataclasses import dataclass
@@ -67,25 +68,56 @@ class CharacterVisual:
 
     def format_symbol(self) -> None:
         """Formats the symbol for printing by applying ANSI sequences for any active modes and color."""
-        formatting_string = ""
-        if self.bold:
-            formatting_string += ansitools.APPLY_BOLD()
-        if self.italic:
-            formatting_string += ansitools.APPLY_ITALIC()
-        if self.underline:
-            formatting_string += ansitools.APPLY_UNDERLINE()
-        if self.blink:
-            formatting_string += ansitools.APPLY_BLINK()
-        if self.reverse:
-            formatting_string += ansitools.APPLY_REVERSE()
-        if self.hidden:
-            formatting_string += ansitools.APPLY_HIDDEN()
-        if self.strike:
-            formatting_string += ansitools.APPLY_STRIKETHROUGH()
-        if self.color is not None:
-            formatting_string += colorterm.fg(self.color)
-
-        self.symbol = f"{formatting_string}{self.symbol}{ansitools.RESET_ALL() if formatting_string else ''}"
+        self.symbol = _formatted_symbol(
+            self.symbol,
+            self.bold,
+            self.italic,
+            self.underline,
+            self.blink,
+            self.reverse,
+            self.hidden,
+            self.strike,
+            self.color,
+        )
+
+
+@functools.lru_cache(maxsize=16384)
+def _formatted_symbol(
+    symbol: str,
+    bold: bool,
+    italic: bool,
+    underline: bool,
+    blink: bool,
+    reverse: bool,
+    hidden: bool,
+    strike: bool,
+    color: str | int | None,
+) -> str:
+    """Returns the symbol wrapped in the ANSI sequences for the given modes and color. Frames with the same
+    appearance share the formatted string, so the sequences are built once rather than once per Frame.
+
+    Returns:
+        str: the formatted symbol
+    """
+    formatting_string = ""
+    if bold:
+        formatting_string += ansitools.APPLY_BOLD()
+    if italic:
+        formatting_string += ansitools.APPLY_ITALIC()
+    if underline:
+        formatting_string += ansitools.APPLY_UNDERLINE()
+    if blink:
+        formatting_string += ansitools.APPLY_BLINK()
+    if reverse:
+        formatting_string += ansitools.APPLY_REVERSE()
+    if hidden:
+        formatting_string += ansitools.APPLY_HIDDEN()
+    if strike:
+        formatting_string += ansitools.APPLY_STRIKETHROUGH()
+    if color is not None:
+        formatting_string += colorterm.fg(color)
+
+    return f"{formatting_string}{symbol}{ansitools.RESET_ALL() if formatting_string else ''}"
 
 
 @dataclass
@@ -304,18 +336,22 @@ class Scene:
 
 
 class Animation:
-    def __init__(self, character: "base_character.EffectCharacter"):
+    def __init__(
+        self, character: "base_character.EffectCharacter", *, use_xterm_colors: bool = False, no_color: bool = False
+    ):
         """Animation handles the animations of a character. It contains a scene_name -> Scene mapping and the active Scene. Calls to step_animation()
         progress the Scene and apply the next symbol to the character.
 
         Args:
             character (base_character.EffectCharacter): the EffectCharacter object to animate
+            use_xterm_colors (bool, optional): Whether to convert all colors to XTerm-256 colors. Defaults to False.
+            no_color (bool, optional): Whether colors should be ignored. Defaults to False.
         """
         self.scenes: dict[str, Scene] = {}
         self.character = character
         self.active_scene: Scene | None = None
-        self.use_xterm_colors: bool = False
-        self.no_color: bool = False
+        self.use_xterm_colors: bool = use_xterm_colors
+        self.no_color: bool = no_color
         self.xterm_color_map: dict[str, int] = {}
         self.active_scene_current_step: int = 0
 
@@ -514,69 +550,66 @@ class Animation:
     def step_animation(self) -> None:
         """Apply the next symbol in the scene to the character. If a scene order exists, the next scene
         will be activated when the current scene is complete."""
-        if self.active_scene and self.active_scene.frames:
+        # the active scene and the character are read many times per step, bind them once
+        active_scene = self.active_scene
+        if active_scene and active_scene.frames:
+            character = self.character
+            frames = active_scene.frames
             # if the active scene is synced to movement, calculate the sequence index based on the
             # current waypoint progress
-            if self.active_scene.sync:
-                if self.character.motion.active_path:
-                    if self.active_scene.sync == SyncMetric.STEP:
+            if active_scene.sync:
+                active_path = character.motion.active_path
+                if active_path:
+                    if active_scene.sync == SyncMetric.STEP:
                         sequence_index = round(
-                            (len(self.active_scene.frames) - 1)
-                            * (
-                                max(self.character.motion.active_path.current_step, 1)
-                                / max(self.character.motion.active_path.max_steps, 1)
-                            )
+                            (len(frames) - 1) * (max(active_path.current_step, 1) / max(active_path.max_steps, 1))
                         )
-                    elif self.active_scene.sync == SyncMetric.DISTANCE:
+                    elif active_scene.sync == SyncMetric.DISTANCE:
+                        total_distance = max(active_path.total_distance, 1)
                         sequence_index = round(
-                            (len(self.active_scene.frames) - 1)
+                            (len(frames) - 1)
                             * (
                                 max(
-                                    max(self.character.motion.active_path.total_distance, 1)
-                                    - max(
-                                        self.character.motion.active_path.total_distance
-                                        - self.character.motion.active_path.last_distance_reached,
-                                        1,
-                                    ),
+                                    total_distance
+                                    - max(active_path.total_distance - active_path.last_distance_reached, 1),
                                     1,
                                 )
-                                / max(self.character.motion.active_path.total_distance, 1)
+                                / total_distance
                             )
                         )
                     try:
-                        self.character.symbol = self.active_scene.frames[sequence_index].symbol
+                        character.symbol = frames[sequence_index].symbol
                     except IndexError:
-                        self.character.symbol = self.active_scene.frames[-1].symbol
+                        character.symbol = frames[-1].symbol
                 else:  # when the active waypoint has been deactivated, use the final symbol in the scene and finish the scene
-                    self.character.symbol = self.active_scene.frames[-1].symbol
-                    self.active_scene.played_frames.extend(self.active_scene.frames)
-                    self.active_scene.frames.clear()
-
-            elif self.active_scene and self.active_scene.ease:
-                easing_factor = self._ease_animation(self.active_scene.ease)
-                frame_index = round(easing_factor * max(self.active_scene.easing_total_steps - 1, 0))
-                frame_index = max(min(frame_index, self.active_scene.easing_total_steps - 1), 0)
-                frame = self.active_scene.frame_index_map[frame_index]
-                self.character.symbol = frame.symbol
-                self.active_scene.easing_current_step += 1
-                if self.active_scene.easing_current_step == self.active_scene.easing_total_steps:
-                    if self.active_scene.is_looping:
-                        self.active_scene.easing_current_step = 0
+                    character.symbol = frames[-1].symbol
+                    active_scene.played_frames.extend(frames)
+                    frames.clear()
+
+            elif active_scene.ease:
+                easing_total_steps = active_scene.easing_total_steps
+                easing_factor = self._ease_animation(active_scene.ease)
+                frame_index = round(easing_factor * max(easing_total_steps - 1, 0))
+                frame_index = max(min(frame_index, easing_total_steps - 1), 0)
+                frame = active_scene.frame_index_map[frame_index]
+                character.symbol = frame.symbol
+                active_scene.easing_current_step += 1
+                if active_scene.easing_current_step == easing_total_steps:
+                    if active_scene.is_looping:
+                        active_scene.easing_current_step = 0
                     else:
-                        self.active_scene.played_frames.extend(self.active_scene.frames)
-                        self.active_scene.frames.clear()
+                        active_scene.played_frames.extend(frames)
+                        frames.clear()
 
             else:
-                self.character.symbol = self.active_scene.get_next_symbol()
-            if self.active_scene_is_complete():
-                completed_scene = self.active_scene
-                if not self.active_scene.is_looping:
-                    self.active_scene.reset_scene()
+                character.symbol = active_scene.get_next_symbol()
+            # equivalent to active_scene_is_complete for the bound active scene
+            if not frames or active_scene.is_looping:
+                if not active_scene.is_looping:
+                    active_scene.reset_scene()
                     self.active_scene = None
 
-                self.character.event_handler._handle_event(
-                    self.character.event_handler.Event.SCENE_COMPLETE, completed_scene
-                )
+                character.event_handler._handle_event(character.event_handler.Event.SCENE_COMPLETE, active_scene)
 
     def activate_scene(self, scene: Scene) -> None:
         """Sets the active scene.
@@ -186,7 +186,19 @@ class EffectCharacter:
         layer (int): The layer of the character. The layer determines the order in which characters are printed.
     """
 
-    def __init__(self, character_id: int, symbol: str, input_column: int, input_row: int):
+    # incremented whenever the layer of any character changes, so orderings sorted by layer can be cached
+    _layer_change_count: typing.ClassVar[int] = 0
+
+    def __init__(
+        self,
+        character_id: int,
+        symbol: str,
+        input_column: int,
+        input_row: int,
+        *,
+        use_xterm_colors: bool = False,
+        no_color: bool = False,
+    ):
         """Initializes the character instance with the character ID, symbol, and input coordinates.
 
         Args:
@@ -194,16 +206,55 @@ class EffectCharacter:
             symbol (str): The symbol for the character in the input data.
             input_column (int): The column of the character in the input data.
             input_row (int): The row of the character in the input data.
+            use_xterm_colors (bool, optional): Whether to convert all colors to XTerm-256 colors. Defaults to False.
+            no_color (bool, optional): Whether colors should be ignored. Defaults to False.
         """
         self._character_id: int = character_id
         self._input_symbol: str = symbol
         self._input_coord: Coord = Coord(input_column, input_row)
         self._is_visible: bool = False
         self.symbol: str = symbol
-        self.animation: animation.Animation = animation.Animation(self)
+        self.animation: animation.Animation = animation.Animation(
+            self, use_xterm_colors=use_xterm_colors, no_color=no_color
+        )
         self.motion: motion.Motion = motion.Motion(self)
         self.event_handler: EventHandler = EventHandler(self)
-        self.layer: int = 0
+        self._layer: int = 0
+
+    @classmethod
+    def bulk_create(
+        cls,
+        specs: typing.Sequence[tuple[str, int, int]],
+        *,
+        start_id: int,
+        use_xterm_colors: bool = False,
+        no_color: bool = False,
+    ) -> list[EffectCharacter]:
+        """Creates a character for each (symbol, input_column, input_row) spec, with consecutive character IDs.
+
+        Args:
+            specs (Sequence[tuple[str, int, int]]): The symbol, input column and input row of each character.
+            start_id (int): The character ID of the first character.
+            use_xterm_colors (bool, optional): Whether to convert all colors to XTerm-256 colors. Defaults to False.
+            no_color (bool, optional): Whether colors should be ignored. Defaults to False.
+
+        Returns:
+            list[EffectCharacter]: The characters, in the order of the specs.
+        """
+        return [
+            cls(character_id, symbol, column, row, use_xterm_colors=use_xterm_colors, no_color=no_color)
+            for character_id, (symbol, column, row) in zip(range(start_id, start_id + len(specs)), specs)
+        ]
+
+    @property
+    def layer(self) -> int:
+        return self._layer
+
+    @layer.setter
+    def layer(self, value: int) -> None:
+        if value != self._layer:
+            self._layer = value
+            EffectCharacter._layer_change_count += 1
 
     @property
     def input_symbol(self) -> str:
@@ -66,13 +66,22 @@ class BaseEffectIterator(ABC, Generic[T]):
         return self.terminal.get_formatted_output_string()
 
     def update(self) -> None:
-        """Run the tick method for all active characters and remove inactive characters from the active list."""
-        _active_characters = []
-        for character in self.active_characters:
+        """Run the tick method for all active characters and remove inactive characters from the active list.
+
+        Inactive characters are removed in place, preserving the order of the remaining characters, so no new list
+        is allocated each frame.
+
+        Characters are ticked serially and in order. Event callbacks triggered by a tick modify effect and terminal
+        state and may draw from the random module, so the order of ticks determines the output.
+        """
+        active_characters = self.active_characters
+        active_count = 0
+        for character in active_characters:
             character.tick()
             if character.is_active:
-                _active_characters.append(character)
-        self.active_characters = _active_characters
+                active_characters[active_count] = character
+                active_count += 1
+        del active_characters[active_count:]
 
     def __iter__(self) -> "BaseEffectIterator":
         return self
@@ -504,8 +504,9 @@ class Motion:
 
         The character's previous coordinate is preserved before moving to allow for clearing the location in the terminal.
         """
-        # preserve previous coordinate to allow for clearing the location in the terminal
-        self.previous_coord = Coord(self.current_coord.column, self.current_coord.row)
+        # preserve previous coordinate to allow for clearing the location in the terminal. Coord is immutable, so the
+        # current coordinate is kept rather than copied
+        self.previous_coord = self.current_coord
 
         if not self.active_path or not self.active_path.segments:
             return
@@ -8,16 +8,22 @@ Classes:
 
 from __future__ import annotations
 
+import operator
+import queue
 import random
+import re
 import shutil
 import sys
+import threading
 import time
+import typing
+from collections import deque
 from dataclasses import dataclass
 from enum import Enum, auto
 
 import terminaltexteffects.utils.argvalidators as argvalidators
 from terminaltexteffects.engine.base_character import EffectCharacter
-from terminaltexteffects.utils import ansitools
+from terminaltexteffects.utils import _sleep, ansitools
 from terminaltexteffects.utils.argsdataclass import ArgField, ArgsDataClass
 from terminaltexteffects.utils.geometry import Coord
 
@@ -31,10 +37,14 @@ class TerminalConfig(ArgsDataClass):
         xterm_colors (bool): Convert any colors specified in RBG hex to the closest XTerm-256 color.
         no_color (bool): Disable all colors in the effect.
         wrap_text (bool): Wrap text wider than the canvas width.
-        frame_rate (float): Target frame rate for the animation.
+        frame_rate (float): Target frame rate for the animation, if set to 0 or less the frame rate is not limited.
         canvas_width (int): Cavas width, if set to 0 the canvas width is detected automatically based on the terminal device.
         canvas_height (int): Canvas height, if set to 0 the canvas height is detected automatically based on the terminal device.
         ignore_terminal_dimensions (bool): Ignore the terminal dimensions and use the input data dimensions for the canvas.
+        coalesce_sgr (bool): Merge adjacent SGR escape sequences in each frame to reduce the bytes written to the terminal.
+        frame_spin_margin (float): Time, in seconds, before each frame deadline spent waiting on the clock rather than sleeping.
+        flush_every (int): Number of frames written before the output is flushed to the terminal.
+        skip_unchanged_rows (bool): Leave out rows unchanged since the previous frame when printing a frame.
     """
 
     tab_width: int = ArgField(
@@ -69,9 +79,9 @@ class TerminalConfig(ArgsDataClass):
 
     frame_rate: float = ArgField(
         cmd_name="--frame-rate",
-        type_parser=argvalidators.PositiveInt.type_parser,
+        type_parser=argvalidators.NonNegativeInt.type_parser,
         default=100,
-        help="""Target frame rate for the animation.""",
+        help="""Target frame rate for the animation, if set to 0 the frame rate is not limited.""",
     )  # type: ignore[assignment]
 
     "float : Minimum time, in seconds, between frames."
@@ -102,6 +112,90 @@ class TerminalConfig(ArgsDataClass):
     )  # type: ignore[assignment]
     "bool : Ignore the terminal dimensions and use the input data dimensions for the canvas."
 
+    coalesce_sgr: bool = ArgField(
+        cmd_name=["--coalesce-sgr"],
+        default=False,
+        action="store_true",
+        help="Merge adjacent SGR escape sequences in each frame to reduce the bytes written to the terminal.",
+    )  # type: ignore[assignment]
+    "bool : Merge adjacent SGR escape sequences in each frame to reduce the bytes written to the terminal."
+
+    frame_spin_margin: float = ArgField(
+        cmd_name=["--frame-spin-margin"],
+        type_parser=argvalidators.NonNegativeFloat.type_parser,
+        metavar=argvalidators.NonNegativeFloat.METAVAR,
+        default=0.0,
+        help="Time, in seconds, before each frame deadline spent waiting on the clock rather than sleeping. Frames "
+        "are timed more accurately at the cost of CPU time. A margin of 0.001 to 0.002 is enough for most systems.",
+    )  # type: ignore[assignment]
+    "float : Time, in seconds, before each frame deadline spent waiting on the clock rather than sleeping."
+
+    flush_every: int = ArgField(
+        cmd_name=["--flush-every"],
+        type_parser=argvalidators.PositiveInt.type_parser,
+        metavar=argvalidators.PositiveInt.METAVAR,
+        default=1,
+        help="Number of frames written before the output is flushed to the terminal. Flushing less often writes "
+        "several frames to the terminal at once, reducing the number of writes at the cost of skipped frames.",
+    )  # type: ignore[assignment]
+    "int : Number of frames written before the output is flushed to the terminal."
+
+    skip_unchanged_rows: bool = ArgField(
+        cmd_name=["--skip-unchanged-rows"],
+        default=False,
+        action="store_true",
+        help="Leave out rows unchanged since the previous frame when printing a frame, reducing the bytes written to "
+        "the terminal. Rows overwritten by other terminal output are not repainted until their content changes.",
+    )  # type: ignore[assignment]
+    "bool : Leave out rows unchanged since the previous frame when printing a frame."
+
+
+# the end of an SGR sequence with a single digit parameter (reset or a graphical mode) and the start of the SGR
+# sequence immediately following it
+_ADJACENT_SGR = re.compile(r"(?<=\x1b\[\d)m\x1b\[(?=[0-9;]*m)")
+
+# sort and group keys for the character input coordinates. orderings on row and column are built from stable sorts
+# on a single key each, which avoids building a key tuple per character. the keys read the attribute behind the
+# input_coord property so the lookup stays in C.
+_INPUT_ROW = operator.attrgetter("_input_coord.row")
+_INPUT_COLUMN = operator.attrgetter("_input_coord.column")
+
+# the number of frame delays a frame may fall behind the schedule before the schedule is re-armed
+_MAX_CATCH_UP_FRAMES = 3
+
+
+def _coalesce_sgr(output: str) -> str:
+    """Merges adjacent SGR sequences into a single sequence with the parameters joined in order, which the terminal
+    applies identically. For example, a reset followed by a color, "\\x1b[0m\\x1b[38;5;1m", becomes "\\x1b[0;38;5;1m".
+
+    Only sequences following a reset or a graphical mode sequence are merged. The color sequence is the last in the
+    formatting of a character, so every adjacent pair in a frame of formatted characters starts with one of these.
+
+    Args:
+        output (str): The string containing SGR sequences.
+
+    Returns:
+        str: The string with adjacent SGR sequences merged.
+    """
+    return _ADJACENT_SGR.sub(";", output)
+
+
+def _return_to_first_row(rows: int) -> str:
+    """Moves the cursor from the last row of a printed frame to the start of its first row.
+
+    A carriage return moves the cursor to the first column. Cursor up is left out for a single row frame, terminals
+    treat a count of zero as one.
+
+    Args:
+        rows (int): The number of rows in the printed frame.
+
+    Returns:
+        str: ANSI escape code
+    """
+    if rows > 1:
+        return "\r" + ansitools.MOVE_CURSOR_UP(rows - 1)
+    return "\r"
+
 
 @dataclass
 class Canvas:
@@ -201,6 +295,8 @@ class Terminal:
         set_character_visibility(character: EffectCharacter, is_visible: bool): Set the visibility of a character.
         get_formatted_output_string() -> str: Get the formatted output string based on the current terminal state.
         print(output_string: str, enforce_frame_rate: bool = True): Prints the current terminal state to stdout while preserving the cursor position.
+        print_frame_bytes(frame: bytes, flush: bool = True, enforce_frame_rate: bool = True): Prints a frame already encoded in the stdout encoding, flushing only when requested.
+        flush(): Flushes frames written since the last flush to the terminal.
 
     """
 
@@ -266,12 +362,14 @@ class Terminal:
         if not input_data:
             input_data = "No Input."
         self._input_data = input_data.replace("\t", " " * self.config.tab_width)
+        # the input is split once, for the dimensions and for decomposing
+        input_lines = self._input_data.splitlines()
         self.detected_terminal_dimensions = self._get_terminal_dimensions()
         self._width = self.config.canvas_width
         self._height = self.config.canvas_height
         if self.config.ignore_terminal_dimensions:
-            self._width = max([len(line) for line in self._input_data.splitlines()])
-            self._height = len(self._input_data.splitlines()) + 1
+            self._width = max([len(line) for line in input_lines])
+            self._height = len(input_lines) + 1
         elif self._width == 0 or self._height == 0:
             if self._width == 0:
                 self._width = self.detected_terminal_dimensions[0]
@@ -279,23 +377,56 @@ class Terminal:
                 self._height = self.detected_terminal_dimensions[1]
 
         self._next_character_id = 0
-        self._input_characters = self._decompose_input(self.config.xterm_colors, self.config.no_color)
+        # characters above the canvas are not created, the canvas top is the lower of the height and the input height
+        self._input_characters, self._input_width, self._input_height = self._decompose_input(
+            input_lines, self.config.xterm_colors, self.config.no_color, max(self._height, 1)
+        )
         self._added_characters: list[EffectCharacter] = []
-        self._input_width = max([character.input_coord.column for character in self._input_characters])
-        self._input_height = max([character.input_coord.row for character in self._input_characters])
         self.canvas = Canvas(min(max(self._height, 1), self._input_height), self._input_width)
-        self._input_characters = [
-            character
-            for character in self._input_characters
-            if character.input_coord.row <= self.canvas.top and character.input_coord.column <= self.canvas.right
-        ]
         self.character_by_input_coord: dict[Coord, EffectCharacter] = {
             (character.input_coord): character for character in self._input_characters
         }
         self._fill_characters = self._make_fill_characters()
+        # sorted character lists keyed by the included character sets and row order, cleared by add_character
+        self._sorted_characters: dict[tuple[bool, bool, bool, bool], list[EffectCharacter]] = {}
         self._visible_characters: set[EffectCharacter] = set()
+        # the visible characters sorted by layer, rebuilt when visibility or the layer of any character changes
+        self._visible_characters_by_layer: list[EffectCharacter] | None = None
+        self._visible_characters_layer_change_count = EffectCharacter._layer_change_count
         self._frame_rate = self.config.frame_rate
-        self._last_time_printed = time.time()
+        # the time between frames, computed once. a frame rate of zero or less is not limited.
+        self._frame_delay = 1 / self._frame_rate if self._frame_rate > 0 else 0.0
+        if not self._frame_delay:
+            # nothing to wait for, print skips reading the clock for every frame
+            self.enforce_framerate = self._skip_framerate  # type: ignore[method-assign]
+        self._frame_spin_margin = self.config.frame_spin_margin
+        # frame delays are slept through the frame sleeper, a platform timer is used while the canvas is prepared
+        self._frame_sleeper = _sleep.FrameSleeper()
+        self._next_frame_deadline = time.perf_counter()
+        # the terminal state grid is reused between frames and reset from a blank row, rather than allocated per frame
+        self._blank_row: list[str] = [" "] * self.canvas.right
+        self._state_rows: list[list[str]] = [self._blank_row.copy() for _ in range(self.canvas.top)]
+        # frames are handed to a writer thread while the canvas is prepared, see prep_canvas and restore_cursor
+        self._output_queue: queue.Queue[str | bytes | None] = queue.Queue(maxsize=2)
+        self._output_thread: threading.Thread | None = None
+        self._output_error: Exception | None = None
+        # the cursor movement to the top of the canvas, and the start of each printed frame, built once. the first
+        # frame starts below the canvas, at the position saved in prep_canvas. later frames start on the last row of
+        # the previous frame and move back to the top relative to it, without restoring the saved position.
+        self._cursor_home_prefix = ansitools.DEC_RESTORE_CURSOR_POSITION() + ansitools.MOVE_CURSOR_UP(self.canvas.top)
+        self._first_frame_prefix = ansitools.BEGIN_SYNCHRONIZED_UPDATE() + ansitools.MOVE_CURSOR_UP(self.canvas.top)
+        self._frame_prefix = ansitools.BEGIN_SYNCHRONIZED_UPDATE() + _return_to_first_row(self.canvas.top)
+        self._frame_suffix = ansitools.END_SYNCHRONIZED_UPDATE()
+        self._flush_every = self.config.flush_every
+        self._skip_unchanged_rows = self.config.skip_unchanged_rows
+        # frames written without a thread since the last flush, the output thread keeps its own count
+        self._frames_since_flush = 0
+        # bytes of the frames written since the last flush when flush_every is above 1, see prep_canvas
+        self._frame_buffer: bytearray | None = None
+        # rows of the last printed frame, the cursor is moved back over them and, with skip_unchanged_rows, unchanged
+        # rows are not rewritten
+        self._printed_rows: list[str] | list[bytes] | None = None
+        self._bind_stdout()
         self._update_terminal_state()
 
     def _get_terminal_dimensions(self) -> tuple[int, int]:
@@ -340,15 +471,16 @@ class Terminal:
         Returns:
             list: The wrapped lines of text.
         """
-        wrapped_lines = []
+        width = self._width
+        wrapped_lines: list[str] = []
         for line in lines:
-            while len(line) > self._width:
-                wrapped_lines.append(line[: self._width])
-                line = line[self._width :]
-            wrapped_lines.append(line)
+            # slice each chunk from the original line rather than re-slicing the remainder, empty lines are kept
+            wrapped_lines.extend(line[start : start + width] for start in range(0, max(len(line), 1), width))
         return wrapped_lines
 
-    def _decompose_input(self, use_xterm_colors: bool, no_color: bool) -> list[EffectCharacter]:
+    def _decompose_input(
+        self, lines: list[str], use_xterm_colors: bool, no_color: bool, max_row: int
+    ) -> tuple[list[EffectCharacter], int, int]:
         """Decomposes the output into a list of Character objects containing the symbol and its row/column coordinates
         relative to the input display location.
 
@@ -356,27 +488,41 @@ class Terminal:
         above the cursor.
 
         Args:
+            lines (list[str]): the lines of the input data
             use_xterm_colors (bool): whether to convert colors to the closest XTerm-256 color
+            no_color (bool): whether colors should be ignored
+            max_row (int): rows above max_row are measured but no characters are created for them
 
         Returns:
-            list[Character]: list of EffectCharacter objects
+            tuple[list[EffectCharacter], int, int]: list of EffectCharacter objects, and the width and height of the
+                input including rows above max_row
         """
-        formatted_lines = []
         if not self._input_data.strip():
             self._input_data = "No Input."
-        lines = self._input_data.splitlines()
+            lines = self._input_data.splitlines()
         formatted_lines = self._wrap_lines(lines) if self.config.wrap_text else [line[: self._width] for line in lines]
-        input_height = len(formatted_lines)
-        input_characters = []
-        for row, line in enumerate(formatted_lines):
-            for column, symbol in enumerate(line):
-                if symbol != " ":
-                    character = EffectCharacter(self._next_character_id, symbol, column + 1, input_height - row)
-                    character.animation.use_xterm_colors = use_xterm_colors
-                    character.animation.no_color = no_color
-                    input_characters.append(character)
-                    self._next_character_id += 1
-        return input_characters
+        line_count = len(formatted_lines)
+        # the input width and height are the rightmost and topmost non-space symbols of any row
+        input_width = max(len(line.rstrip(" ")) for line in formatted_lines)
+        input_height = max(line_count - index for index, line in enumerate(formatted_lines) if line.strip(" "))
+        # rows above max_row are the first lines. their character IDs are skipped, so the IDs of the remaining
+        # characters do not depend on max_row.
+        first_line = max(line_count - max_row, 0)
+        skipped_count = sum(len(line) - line.count(" ") for line in formatted_lines[:first_line])
+        specs = [
+            (symbol, column + 1, line_count - index)
+            for index, line in enumerate(formatted_lines[first_line:], first_line)
+            for column, symbol in enumerate(line)
+            if symbol != " "
+        ]
+        input_characters = EffectCharacter.bulk_create(
+            specs,
+            start_id=self._next_character_id + skipped_count,
+            use_xterm_colors=use_xterm_colors,
+            no_color=no_color,
+        )
+        self._next_character_id += skipped_count + len(specs)
+        return input_characters, input_width, input_height
 
     def _make_fill_characters(self) -> list[EffectCharacter]:
         """Creates a list of characters to fill the empty spaces in the canvas. The characters input_symbol is a space.
@@ -385,17 +531,26 @@ class Terminal:
         Returns:
             list[EffectCharacter]: list of characters
         """
-        fill_characters = []
+        # the occupied columns of each row are collected once, so the scan is a set lookup per cell rather than
+        # building a Coord for every cell of the canvas
+        occupied_columns_by_row: dict[int, set[int]] = {}
+        for coord in self.character_by_input_coord:
+            occupied_columns_by_row.setdefault(coord.row, set()).add(coord.column)
+        specs: list[tuple[str, int, int]] = []
         for row in range(1, self.canvas.top + 1):
-            for column in range(1, self.canvas.right + 1):
-                coord = Coord(column, row)
-                if coord not in self.character_by_input_coord:
-                    fill_char = EffectCharacter(self._next_character_id, " ", column, row)
-                    fill_char.animation.use_xterm_colors = self.config.xterm_colors
-                    fill_char.animation.no_color = self.config.no_color
-                    fill_characters.append(fill_char)
-                    self.character_by_input_coord[coord] = fill_char
-                    self._next_character_id += 1
+            occupied_columns = occupied_columns_by_row.get(row, set())
+            specs.extend(
+                (" ", column, row) for column in range(1, self.canvas.right + 1) if column not in occupied_columns
+            )
+        fill_characters = EffectCharacter.bulk_create(
+            specs,
+            start_id=self._next_character_id,
+            use_xterm_colors=self.config.xterm_colors,
+            no_color=self.config.no_color,
+        )
+        self._next_character_id += len(specs)
+        for fill_char in fill_characters:
+            self.character_by_input_coord[fill_char.input_coord] = fill_char
         return fill_characters
 
     def add_character(self, symbol: str, coord: Coord) -> EffectCharacter:
@@ -408,10 +563,16 @@ class Terminal:
         Returns:
             EffectCharacter: the character that was added
         """
-        character = EffectCharacter(self._next_character_id, symbol, coord.column, coord.row)
-        character.animation.use_xterm_colors = self.config.xterm_colors
-        character.animation.no_color = self.config.no_color
+        character = EffectCharacter(
+            self._next_character_id,
+            symbol,
+            coord.column,
+            coord.row,
+            use_xterm_colors=self.config.xterm_colors,
+            no_color=self.config.no_color,
+        )
         self._added_characters.append(character)
+        self._sorted_characters.clear()
         self._next_character_id += 1
         return character
 
@@ -419,15 +580,57 @@ class Terminal:
         """Update the internal representation of the terminal state with the current position
         of all visible characters.
         """
-        rows = [[" " for _ in range(self.canvas.right)] for _ in range(self.canvas.top)]
-        for character in sorted(self._visible_characters, key=lambda c: c.layer):
-            row = character.motion.current_coord.row - 1
-            column = character.motion.current_coord.column - 1
-            if 0 <= row < self.canvas.top and 0 <= column < self.canvas.right:
-                rows[row][column] = character.symbol
+        rows = self._state_rows
+        blank_row = self._blank_row
+        for row in rows:
+            row[:] = blank_row
+        canvas_top = self.canvas.top
+        canvas_right = self.canvas.right
+        if (
+            self._visible_characters_by_layer is None
+            or self._visible_characters_layer_change_count != EffectCharacter._layer_change_count
+        ):
+            self._visible_characters_by_layer = sorted(self._visible_characters, key=operator.attrgetter("layer"))
+            self._visible_characters_layer_change_count = EffectCharacter._layer_change_count
+        for character in self._visible_characters_by_layer:
+            # the coordinate is unpacked once, and compared against the 1-based canvas bounds before indexing
+            column, row = character.motion.current_coord
+            if 0 < row <= canvas_top and 0 < column <= canvas_right:
+                rows[row - 1][column - 1] = character.symbol
         terminal_state = ["".join(row) for row in rows]
         self.terminal_state = terminal_state
 
+    def _get_sorted_characters(
+        self, input_characters: bool, fill_chars: bool, added_chars: bool, bottom_to_top: bool
+    ) -> list[EffectCharacter]:
+        """Get the included characters sorted top to bottom, or bottom to top, and left to right. The sorted list is
+        cached until a character is added. The returned list is shared and must not be modified.
+
+        Args:
+            input_characters (bool): whether to include input characters
+            fill_chars (bool): whether to include fill characters
+            added_chars (bool): whether to include added characters
+            bottom_to_top (bool): whether to sort the rows bottom to top rather than top to bottom
+
+        Returns:
+            list[EffectCharacter]: sorted list of EffectCharacters
+        """
+        key = (input_characters, fill_chars, added_chars, bottom_to_top)
+        sorted_characters = self._sorted_characters.get(key)
+        if sorted_characters is None:
+            sorted_characters = []
+            if input_characters:
+                sorted_characters.extend(self._input_characters)
+            if fill_chars:
+                sorted_characters.extend(self._fill_characters)
+            if added_chars:
+                sorted_characters.extend(self._added_characters)
+            # both sorts are stable, characters sharing an input coordinate keep their order
+            sorted_characters.sort(key=_INPUT_COLUMN)
+            sorted_characters.sort(key=_INPUT_ROW, reverse=not bottom_to_top)
+            self._sorted_characters[key] = sorted_characters
+        return sorted_characters
+
     def get_characters(
         self,
         *,
@@ -447,32 +650,25 @@ class Terminal:
         Returns:
             list[EffectCharacter]: list of EffectCharacters in the terminal
         """
-        all_characters: list[EffectCharacter] = []
-        if input_characters:
-            all_characters.extend(self._input_characters)
-        if fill_chars:
-            all_characters.extend(self._fill_characters)
-        if added_chars:
-            all_characters.extend(self._added_characters)
-
-        # default sort TOP_TO_BOTTOM_LEFT_TO_RIGHT
-        all_characters.sort(key=lambda character: (-character.input_coord.row, character.input_coord.column))
+        bottom_to_top = sort in (
+            self.CharacterSort.BOTTOM_TO_TOP_LEFT_TO_RIGHT,
+            self.CharacterSort.TOP_TO_BOTTOM_RIGHT_TO_LEFT,
+        )
+        # copy the cached ordering, callers are free to modify the returned list
+        all_characters = list(self._get_sorted_characters(input_characters, fill_chars, added_chars, bottom_to_top))
 
         if sort is self.CharacterSort.RANDOM:
             random.shuffle(all_characters)
 
-        elif sort in (self.CharacterSort.TOP_TO_BOTTOM_LEFT_TO_RIGHT, self.CharacterSort.BOTTOM_TO_TOP_RIGHT_TO_LEFT):
-            if sort is self.CharacterSort.BOTTOM_TO_TOP_RIGHT_TO_LEFT:
-                all_characters.reverse()
-
-        elif sort in (self.CharacterSort.BOTTOM_TO_TOP_LEFT_TO_RIGHT, self.CharacterSort.TOP_TO_BOTTOM_RIGHT_TO_LEFT):
-            all_characters.sort(key=lambda character: (character.input_coord.row, character.input_coord.column))
-            if sort is self.CharacterSort.TOP_TO_BOTTOM_RIGHT_TO_LEFT:
-                all_characters.reverse()
+        elif sort in (self.CharacterSort.BOTTOM_TO_TOP_RIGHT_TO_LEFT, self.CharacterSort.TOP_TO_BOTTOM_RIGHT_TO_LEFT):
+            all_characters.reverse()
 
         elif sort in (self.CharacterSort.OUTSIDE_ROW_TO_MIDDLE, self.CharacterSort.MIDDLE_ROW_TO_OUTSIDE):
+            # alternate between the ends of the sorted characters, a deque pops from both ends in constant time
+            characters_from_ends = deque(all_characters)
             all_characters = [
-                all_characters.pop(0) if i % 2 == 0 else all_characters.pop(-1) for i in range(len(all_characters))
+                characters_from_ends.popleft() if i % 2 == 0 else characters_from_ends.pop()
+                for i in range(len(characters_from_ends))
             ]
             if sort is self.CharacterSort.MIDDLE_ROW_TO_OUTSIDE:
                 all_characters.reverse()
@@ -498,36 +694,17 @@ class Terminal:
         Returns:
             list[list[EffectCharacter]]: list of lists of EffectCharacters in the terminal. Inner lists correspond to groups as specified in the grouping.
         """
-        all_characters: list[EffectCharacter] = []
-        if input_characters:
-            all_characters.extend(self._input_characters)
-        if fill_chars:
-            all_characters.extend(self._fill_characters)
-        if added_chars:
-            all_characters.extend(self._added_characters)
-
-        all_characters.sort(key=lambda character: (character.input_coord.row, character.input_coord.column))
+        # the characters are only read while grouping, so the cached ordering is used without a copy
+        all_characters = self._get_sorted_characters(input_characters, fill_chars, added_chars, True)
 
         if grouping in (self.CharacterGroup.COLUMN_LEFT_TO_RIGHT, self.CharacterGroup.COLUMN_RIGHT_TO_LEFT):
-            columns = []
-            for column_index in range(self.canvas.right + 1):
-                characters_in_column = [
-                    character for character in all_characters if character.input_coord.column == column_index
-                ]
-                if characters_in_column:
-                    columns.append(characters_in_column)
+            columns = self._group_characters(all_characters, _INPUT_COLUMN, range(self.canvas.right + 1))
             if grouping == self.CharacterGroup.COLUMN_RIGHT_TO_LEFT:
                 columns.reverse()
             return columns
 
         elif grouping in (self.CharacterGroup.ROW_BOTTOM_TO_TOP, self.CharacterGroup.ROW_TOP_TO_BOTTOM):
-            rows = []
-            for row_index in range(self.canvas.top + 1):
-                characters_in_row = [
-                    character for character in all_characters if character.input_coord.row == row_index
-                ]
-                if characters_in_row:
-                    rows.append(characters_in_row)
+            rows = self._group_characters(all_characters, _INPUT_ROW, range(self.canvas.top + 1))
             if grouping == self.CharacterGroup.ROW_TOP_TO_BOTTOM:
                 rows.reverse()
             return rows
@@ -535,15 +712,11 @@ class Terminal:
             self.CharacterGroup.DIAGONAL_BOTTOM_LEFT_TO_TOP_RIGHT,
             self.CharacterGroup.DIAGONAL_TOP_RIGHT_TO_BOTTOM_LEFT,
         ):
-            diagonals = []
-            for diagonal_index in range(self.canvas.top + self.canvas.right + 1):
-                characters_in_diagonal = [
-                    character
-                    for character in all_characters
-                    if character.input_coord.row + character.input_coord.column == diagonal_index
-                ]
-                if characters_in_diagonal:
-                    diagonals.append(characters_in_diagonal)
+            diagonals = self._group_characters(
+                all_characters,
+                lambda character: character.input_coord.row + character.input_coord.column,
+                range(self.canvas.top + self.canvas.right + 1),
+            )
             if grouping == self.CharacterGroup.DIAGONAL_TOP_RIGHT_TO_BOTTOM_LEFT:
                 diagonals.reverse()
             return diagonals
@@ -551,15 +724,11 @@ class Terminal:
             self.CharacterGroup.DIAGONAL_TOP_LEFT_TO_BOTTOM_RIGHT,
             self.CharacterGroup.DIAGONAL_BOTTOM_RIGHT_TO_TOP_LEFT,
         ):
-            diagonals = []
-            for diagonal_index in range(self.canvas.left - self.canvas.top, self.canvas.right - self.canvas.bottom + 1):
-                characters_in_diagonal = [
-                    character
-                    for character in all_characters
-                    if character.input_coord.column - character.input_coord.row == diagonal_index
-                ]
-                if characters_in_diagonal:
-                    diagonals.append(characters_in_diagonal)
+            diagonals = self._group_characters(
+                all_characters,
+                lambda character: character.input_coord.column - character.input_coord.row,
+                range(self.canvas.left - self.canvas.top, self.canvas.right - self.canvas.bottom + 1),
+            )
             if grouping == self.CharacterGroup.DIAGONAL_BOTTOM_RIGHT_TO_TOP_LEFT:
                 diagonals.reverse()
             return diagonals
@@ -585,6 +754,27 @@ class Terminal:
         else:
             raise ValueError(f"Invalid sort_order: {grouping}")
 
+    @staticmethod
+    def _group_characters(
+        characters: list[EffectCharacter],
+        group_index: typing.Callable[[EffectCharacter], int],
+        group_indexes: range,
+    ) -> list[list[EffectCharacter]]:
+        """Group characters in a single pass by the index returned from group_index.
+
+        Args:
+            characters (list[EffectCharacter]): characters to group, in the order they should appear within each group
+            group_index (typing.Callable[[EffectCharacter], int]): function returning the group index of a character
+            group_indexes (range): group indexes to include, in order. Characters in any other group are excluded.
+
+        Returns:
+            list[list[EffectCharacter]]: the non-empty groups in the order of group_indexes
+        """
+        groups: dict[int, list[EffectCharacter]] = {}
+        for character in characters:
+            groups.setdefault(group_index(character), []).append(character)
+        return [groups[index] for index in group_indexes if index in groups]
+
     def get_character_by_input_coord(self, coord: Coord) -> EffectCharacter | None:
         """Get an EffectCharacter by its input coordinates.
 
@@ -607,9 +797,12 @@ class Terminal:
         """
         character._is_visible = is_visible
         if is_visible:
-            self._visible_characters.add(character)
-        else:
+            if character not in self._visible_characters:
+                self._visible_characters.add(character)
+                self._visible_characters_by_layer = None
+        elif character in self._visible_characters:
             self._visible_characters.discard(character)
+            self._visible_characters_by_layer = None
 
     def get_formatted_output_string(self) -> str:
         """Get the formatted output string based on the current terminal state.
@@ -620,23 +813,56 @@ class Terminal:
             str: The formatted output string.
         """
         self._update_terminal_state()
-        output_string = "\n".join(self.terminal_state[::-1])
+        output_string = "\n".join(reversed(self.terminal_state))
+        if self.config.coalesce_sgr:
+            output_string = _coalesce_sgr(output_string)
         return output_string
 
     def prep_canvas(self) -> None:
         """Prepares the terminal for the effect by adding empty lines and hiding the cursor."""
-        sys.stdout.write(ansitools.HIDE_CURSOR())
-        sys.stdout.write(("\n" * (self.canvas.top)))
-        sys.stdout.write(ansitools.DEC_SAVE_CURSOR_POSITION())
+        self._bind_stdout()
+        self._printed_rows = None
+        self._frames_since_flush = 0
+        # text written to stdout before the effect must reach the stream ahead of the effect output
+        self._stdout.flush()
+        if self._flush_every > 1 and self._stdout_buffer is not None:
+            # frames between flushes are collected and sent to the stdout buffer in a single write when flushed.
+            # writes larger than the stdout buffer are otherwise passed straight through, one write per frame.
+            self._frame_buffer = bytearray()
+        self._write_bytes_to_stdout(
+            ansitools.HIDE_CURSOR_BYTES + b"\n" * self.canvas.top + ansitools.DEC_SAVE_CURSOR_POSITION_BYTES
+        )
+        self._frame_sleeper = _sleep.platform_sleeper()
+        # frames printed while the canvas is prepared are written by a separate thread, so writing a frame to the
+        # terminal overlaps with building the next one
+        self._output_thread = threading.Thread(target=self._write_queued_output, daemon=True)
+        self._output_thread.start()
 
     def restore_cursor(self, end_symbol: str = "\n") -> None:
         """Restores the cursor visibility and prints the end_symbol.
 
         Args:
             end_symbol (str, optional): The symbol to print after the effect has completed. Defaults to newline.
+
+        Raises:
+            Exception: An error raised while the output thread wrote the last frames, raised once the cursor is
+                restored.
         """
-        sys.stdout.write(ansitools.SHOW_CURSOR())
-        sys.stdout.write(end_symbol)
+        if self._output_thread is not None:
+            # write any queued frames before restoring the cursor
+            self._output_queue.put(None)
+            self._output_thread.join()
+            self._output_thread = None
+        self._write_bytes_to_stdout(ansitools.SHOW_CURSOR_BYTES)
+        self._write_to_stdout(end_symbol)
+        self._flush_stdout()
+        self._frame_buffer = None
+        self._frame_sleeper.close()
+        self._frame_sleeper = _sleep.FrameSleeper()
+        if self._output_error is not None:
+            output_error = self._output_error
+            self._output_error = None
+            raise output_error
 
     def print(self, output_string: str, *, enforce_frame_rate: bool = True) -> None:
         """Prints the current terminal state to stdout while preserving the cursor position.
@@ -653,20 +879,245 @@ class Terminal:
         """
         if enforce_frame_rate:
             self.enforce_framerate()
-        self.move_cursor_to_top()
-        sys.stdout.write(output_string)
-        sys.stdout.flush()
-
-    def enforce_framerate(self):
-        """Enforces the frame rate set in the terminal config by sleeping if the time since
-        the last frame is shorter than the expected frame delay."""
-        frame_delay = 1 / self._frame_rate
-        time_since_last_print = time.time() - self._last_time_printed
-        if time_since_last_print < frame_delay:
-            time.sleep(frame_delay - time_since_last_print)
-        self._last_time_printed = time.time()
+        rows = output_string.split("\n")
+        printed_rows = self._printed_rows
+        frame_prefix = self._start_frame(rows)
+        # with skip_unchanged_rows, rows identical to the row printed at the same position in the previous frame are
+        # left out, only the newline is written to move the cursor past them. the terminal already shows their content.
+        if self._skip_unchanged_rows and printed_rows is not None and len(printed_rows) == len(rows):
+            output_string = "\n".join(
+                [row if row != printed_row else "" for row, printed_row in zip(rows, printed_rows)]
+            )
+        # the cursor movement and the frame are sent in a single write to avoid a write per sequence. the frame is
+        # wrapped in a synchronized update so supporting terminals render it at once rather than mid-write.
+        # terminals without support ignore the sequences.
+        output = f"{frame_prefix}{output_string}{self._frame_suffix}"
+        if self._output_error is not None:
+            raise self._output_error
+        if self._output_thread is None:
+            self._write_to_stdout(output)
+            self._frames_since_flush += 1
+            if self._frames_since_flush >= self._flush_every:
+                self._flush_stdout()
+                self._frames_since_flush = 0
+        else:
+            # the queue is bounded, blocking here when the terminal falls behind rather than buffering frames
+            self._output_queue.put(output)
+
+    def print_frame_bytes(self, frame: bytes, *, flush: bool = True, enforce_frame_rate: bool = True) -> None:
+        """Prints a frame already encoded in the stdout encoding, such as the output of get_formatted_output_string
+        encoded by the caller, with the cursor movement and synchronized update of print. The frame is written as is,
+        without comparing its rows to the previous frame.
+
+        Unlike print, the frame does not count towards TerminalConfig.flush_every. It is flushed when flush is True,
+        otherwise it is held with the following frames until a frame is flushed or flush is called, so callers
+        writing many partial updates can send them together.
+
+        Args:
+            frame (bytes): The encoded frame, rows separated by newlines.
+            flush (bool, optional): Whether to flush the output after the frame. Defaults to True.
+            enforce_frame_rate (bool, optional): Whether to enforce the frame rate set in the terminal config. Defaults to True.
+        """
+        if enforce_frame_rate:
+            self.enforce_framerate()
+        frame_prefix = self._start_frame(frame.split(b"\n"))
+        output = b"".join((frame_prefix.encode("ascii"), frame, ansitools.END_SYNCHRONIZED_UPDATE_BYTES))
+        if self._output_error is not None:
+            raise self._output_error
+        if self._output_thread is None:
+            self._write_frame_bytes(output)
+            if flush:
+                self._flush_stdout()
+                self._frames_since_flush = 0
+        else:
+            self._output_queue.put(output)
+            if flush:
+                self._output_queue.put("")
+
+    def _start_frame(self, rows: list[str] | list[bytes]) -> str:
+        """Records the rows of the frame being printed and returns the start of the frame, the synchronized update
+        and the cursor movement from the end of the previous frame to the top of the canvas.
+
+        Args:
+            rows (list[str] | list[bytes]): The rows of the frame being printed.
+
+        Returns:
+            str: ANSI escape codes
+        """
+        printed_rows = self._printed_rows
+        self._printed_rows = rows
+        if printed_rows is None:
+            return self._first_frame_prefix
+        # the cursor is on the last row of the previous frame. after move_cursor_to_top no rows are recorded, the
+        # cursor is already on the first row and only the carriage return is written.
+        if len(printed_rows) == self.canvas.top:
+            return self._frame_prefix
+        return ansitools.BEGIN_SYNCHRONIZED_UPDATE() + _return_to_first_row(len(printed_rows))
+
+    def flush(self) -> None:
+        """Flushes frames written since the last flush to the terminal. Frames are flushed every
+        TerminalConfig.flush_every frames, callers may flush early, for example before pausing between frames."""
+        if self._output_error is not None:
+            raise self._output_error
+        if self._output_thread is None:
+            self._flush_stdout()
+            self._frames_since_flush = 0
+        else:
+            # an empty string is a flush request, queued so it follows the frames already queued
+            self._output_queue.put("")
+
+    def _write_queued_output(self) -> None:
+        """Writes frames from the output queue to stdout until the queue yields None. Runs on the output thread.
+        Output is flushed every flush_every frames, and whenever the queue yields an empty string. Encoded frames
+        do not count towards flush_every.
+
+        An error raised while writing is stored and raised from the next call to print. Remaining frames are
+        discarded so print does not block on a full queue."""
+        frames_since_flush = 0
+        while True:
+            output = self._output_queue.get()
+            if output is None:
+                return
+            if self._output_error is not None:
+                continue
+            try:
+                if isinstance(output, bytes):
+                    # frames from print_frame_bytes, flushed by a following flush request
+                    self._write_frame_bytes(output)
+                elif output:
+                    self._write_to_stdout(output)
+                    frames_since_flush += 1
+                if not output or frames_since_flush >= self._flush_every:
+                    self._flush_stdout()
+                    frames_since_flush = 0
+            # any error is forwarded rather than only the errors a write is expected to raise. an error escaping
+            # the thread would end it, and print would block on the full queue with nothing left to drain it.
+            except Exception as e:  # noqa: BLE001
+                self._output_error = e
+
+    def _bind_stdout(self) -> None:
+        """Binds the current stdout, its binary buffer, and its encoding for writing terminal output. Called when the
+        Terminal is created and again when the canvas is prepared, so the stream is looked up once per effect rather
+        than on every write."""
+        self._stdout = sys.stdout
+        self._stdout_buffer = getattr(self._stdout, "buffer", None)
+        self._stdout_encoding = getattr(self._stdout, "encoding", None) or "utf-8"
+        self._stdout_errors = getattr(self._stdout, "errors", None) or "strict"
+
+    def _flush_stdout(self) -> None:
+        """Writes the output collected in the frame buffer, if any, to the stdout buffer and flushes stdout."""
+        if self._frame_buffer:
+            # the frame buffer is only opened for streams with a binary buffer, see prep_canvas
+            stdout_buffer = self._stdout_buffer
+            assert stdout_buffer is not None
+            stdout_buffer.write(self._frame_buffer)
+            self._frame_buffer.clear()
+        self._stdout.flush()
+
+    def _write_to_buffer(self, output: bytes) -> None:
+        """Writes encoded output to the frame buffer while one is collecting frames, otherwise to the stdout buffer.
+        Only called for streams with a binary buffer.
+
+        Args:
+            output (bytes): The bytes to write.
+        """
+        if self._frame_buffer is None:
+            stdout_buffer = self._stdout_buffer
+            assert stdout_buffer is not None
+            stdout_buffer.write(output)
+        else:
+            self._frame_buffer += output
+
+    def _write_to_stdout(self, output: str) -> None:
+        """Writes the output to the bound stdout. The output is encoded once and written to the binary buffer
+        underlying stdout, skipping the per-write work of the text layer. Streams without a binary buffer are written
+        as text.
+
+        Args:
+            output (str): The string to write.
+        """
+        if self._stdout_buffer is None:
+            self._stdout.write(output)
+        else:
+            self._write_to_buffer(output.encode(self._stdout_encoding, self._stdout_errors))
+
+    def _write_bytes_to_stdout(self, output: bytes) -> None:
+        """Writes already encoded ASCII output, such as the ansitools bytes constants, to the bound stdout. Streams
+        without a binary buffer are written as text.
+
+        Args:
+            output (bytes): The bytes to write.
+        """
+        if self._stdout_buffer is None:
+            self._stdout.write(output.decode("ascii"))
+        else:
+            self._write_to_buffer(output)
+
+    def _write_frame_bytes(self, output: bytes) -> None:
+        """Writes an encoded frame to the bound stdout. Streams without a binary buffer are written as text, decoded
+        with the stdout encoding.
+
+        Args:
+            output (bytes): The bytes to write.
+        """
+        if self._stdout_buffer is None:
+            self._stdout.write(output.decode(self._stdout_encoding, self._stdout_errors))
+        else:
+            self._write_to_buffer(output)
+
+    def enforce_framerate(self) -> bool:
+        """Enforces the frame rate set in the terminal config by sleeping until the next frame deadline.
+
+        The deadline is advanced by the frame delay rather than reset to the time after sleeping, so time spent
+        producing a frame does not add to the delay. A frame late by up to _MAX_CATCH_UP_FRAMES frame delays keeps
+        the schedule, and the following frames catch up on it. A frame later than that re-arms the schedule from the
+        current time, so a long stall does not cause a burst of catch-up frames.
+
+        Returns:
+            bool: True if the frame was on schedule, False if the deadline had already passed. Callers producing
+                frames faster than they can be shown may use this to skip work for late frames.
+        """
+        frame_delay = self._frame_delay
+        deadline = self._next_frame_deadline + frame_delay
+        now = time.perf_counter()
+        if now < deadline:
+            self._sleep_until(deadline, now)
+            self._next_frame_deadline = deadline
+            return True
+        self._next_frame_deadline = now if now - deadline > _MAX_CATCH_UP_FRAMES * frame_delay else deadline
+        return False
+
+    def _skip_framerate(self) -> bool:
+        """Replaces enforce_framerate when the frame rate is not limited. Every frame is past its deadline, as with
+        enforce_framerate and a frame delay of zero.
+
+        Returns:
+            bool: False
+        """
+        return False
+
+    def _sleep_until(self, deadline: float, now: float) -> None:
+        """Sleeps until the perf_counter deadline. Sleeping may wake later than requested, so the last
+        frame_spin_margin seconds before the deadline are spent waiting on the clock instead.
+
+        Args:
+            deadline (float): perf_counter time to sleep until
+            now (float): current perf_counter time
+        """
+        if deadline - now > self._frame_spin_margin:
+            self._frame_sleeper.sleep_until(deadline - self._frame_spin_margin)
+        while time.perf_counter() < deadline:
+            pass
 
     def move_cursor_to_top(self):
-        """Restores the cursor position to the top of the canvas."""
-        sys.stdout.write(ansitools.DEC_RESTORE_CURSOR_POSITION())
-        sys.stdout.write(ansitools.MOVE_CURSOR_UP(self.canvas.top))
+        """Restores the cursor position to the top of the canvas. While the canvas is prepared, the cursor movement
+        is queued behind the frames not yet written."""
+        if self._output_error is not None:
+            raise self._output_error
+        if self._output_thread is None:
+            self._write_to_stdout(self._cursor_home_prefix)
+        else:
+            # queued encoded so it does not count as a frame towards flush_every
+            self._output_queue.put(self._cursor_home_prefix.encode("ascii"))
+        # the next frame starts from the first row rather than the last row of the previous frame
+        self._printed_rows = []
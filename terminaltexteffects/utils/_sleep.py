@@ -0,0 +1,199 @@
+"""Sleepers used by the Terminal to wait for frame deadlines.
+
+Python 3.11 and later already sleep on a high resolution timer on Windows and to an absolute CLOCK_MONOTONIC deadline
+on Linux, so time.sleep is used there. The platform sleepers are only used by older versions.
+
+Classes:
+    FrameSleeper: Sleeps until a perf_counter deadline using time.sleep.
+    HighResolutionTimerSleeper: Sleeps on a Windows high resolution waitable timer.
+    TimerResolutionSleeper: Sleeps using time.sleep with the Windows timer resolution raised to 1 ms.
+    AbsoluteMonotonicSleeper: Sleeps with clock_nanosleep until an absolute CLOCK_MONOTONIC deadline.
+
+Functions:
+    platform_sleeper: Returns the sleeper for the current platform and Python version.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import sys
+import time
+
+
+class FrameSleeper:
+    """Sleeps until a perf_counter deadline using time.sleep. Subclasses sleep on a platform timer that wakes closer
+    to the deadline."""
+
+    def sleep_until(self, deadline: float) -> None:
+        """Sleeps until the deadline. Returns immediately if the deadline has passed.
+
+        Args:
+            deadline (float): perf_counter time to sleep until
+        """
+        remaining = deadline - time.perf_counter()
+        if remaining > 0:
+            time.sleep(remaining)
+
+    def close(self) -> None:
+        """Releases any resources held by the sleeper."""
+
+
+class HighResolutionTimerSleeper(FrameSleeper):
+    """Sleeps on a Windows high resolution waitable timer. High resolution timers wake close to their due time
+    without raising the system timer resolution. They are available from Windows 10 version 1803.
+
+    Raises:
+        OSError: The timer could not be created.
+        AttributeError: The kernel32 timer functions are not available.
+    """
+
+    _CREATE_WAITABLE_TIMER_HIGH_RESOLUTION = 0x00000002
+    _TIMER_ALL_ACCESS = 0x001F0003
+    _INFINITE = 0xFFFFFFFF
+
+    def __init__(self) -> None:
+        # imported here rather than at module level, the Windows types are only needed when the timer is created
+        from ctypes import wintypes
+
+        kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)  # type: ignore[attr-defined]
+        kernel32.CreateWaitableTimerExW.restype = wintypes.HANDLE
+        kernel32.CreateWaitableTimerExW.argtypes = (
+            wintypes.LPVOID,
+            wintypes.LPCWSTR,
+            wintypes.DWORD,
+            wintypes.DWORD,
+        )
+        kernel32.SetWaitableTimer.restype = wintypes.BOOL
+        kernel32.SetWaitableTimer.argtypes = (
+            wintypes.HANDLE,
+            ctypes.POINTER(wintypes.LARGE_INTEGER),
+            wintypes.LONG,
+            wintypes.LPVOID,
+            wintypes.LPVOID,
+            wintypes.BOOL,
+        )
+        kernel32.WaitForSingleObject.restype = wintypes.DWORD
+        kernel32.WaitForSingleObject.argtypes = (wintypes.HANDLE, wintypes.DWORD)
+        kernel32.CloseHandle.restype = wintypes.BOOL
+        kernel32.CloseHandle.argtypes = (wintypes.HANDLE,)
+        handle = kernel32.CreateWaitableTimerExW(
+            None, None, self._CREATE_WAITABLE_TIMER_HIGH_RESOLUTION, self._TIMER_ALL_ACCESS
+        )
+        if not handle:
+            raise ctypes.WinError(ctypes.get_last_error())  # type: ignore[attr-defined]
+        self._kernel32 = kernel32
+        self._handle = handle
+        self._due_time = wintypes.LARGE_INTEGER()
+
+    def sleep_until(self, deadline: float) -> None:
+        remaining = deadline - time.perf_counter()
+        if remaining <= 0:
+            return
+        # a negative due time is relative to the current time, in 100 nanosecond intervals
+        self._due_time.value = -int(remaining * 10_000_000)
+        if self._kernel32.SetWaitableTimer(self._handle, ctypes.byref(self._due_time), 0, None, None, False):
+            self._kernel32.WaitForSingleObject(self._handle, self._INFINITE)
+        else:
+            time.sleep(remaining)
+
+    def close(self) -> None:
+        if self._handle:
+            self._kernel32.CloseHandle(self._handle)
+            self._handle = None
+
+
+class TimerResolutionSleeper(FrameSleeper):
+    """Sleeps using time.sleep with the Windows timer resolution raised to 1 ms. Without high resolution timers,
+    sleeps on Windows are rounded up to the system timer interval, about 15.6 ms by default. The resolution is
+    restored when the sleeper is closed.
+
+    Raises:
+        OSError: The timer resolution could not be raised.
+        AttributeError: winmm is not available.
+    """
+
+    def __init__(self) -> None:
+        self._winmm = ctypes.windll.winmm  # type: ignore[attr-defined]
+        if self._winmm.timeBeginPeriod(1) != 0:
+            raise OSError("timer resolution could not be raised")
+        self._raised = True
+
+    def close(self) -> None:
+        if self._raised:
+            self._winmm.timeEndPeriod(1)
+            self._raised = False
+
+
+class _Timespec(ctypes.Structure):
+    # time_t is 64 bits on the 64-bit platforms AbsoluteMonotonicSleeper is used on, tv_nsec is a long everywhere
+    _fields_ = [("tv_sec", ctypes.c_int64), ("tv_nsec", ctypes.c_long)]
+
+
+class AbsoluteMonotonicSleeper(FrameSleeper):
+    """Sleeps with clock_nanosleep until an absolute CLOCK_MONOTONIC deadline. Time spent before the call, or
+    restarting it after a signal, does not extend the sleep.
+
+    Raises:
+        OSError: perf_counter does not read CLOCK_MONOTONIC, so deadlines cannot be passed to the kernel, or the
+            platform is not 64-bit, where the width of time_t is not known.
+        AttributeError: clock_nanosleep is not available.
+    """
+
+    _CLOCK_MONOTONIC = 1
+    _TIMER_ABSTIME = 1
+    _EINTR = 4
+
+    def __init__(self) -> None:
+        if time.get_clock_info("perf_counter").implementation != "clock_gettime(CLOCK_MONOTONIC)":
+            raise OSError("perf_counter does not read CLOCK_MONOTONIC")
+        if ctypes.sizeof(ctypes.c_void_p) != 8:
+            raise OSError("time_t width is not known on 32-bit platforms")
+        clock_nanosleep = ctypes.CDLL(None, use_errno=True).clock_nanosleep
+        clock_nanosleep.restype = ctypes.c_int
+        clock_nanosleep.argtypes = (
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.POINTER(_Timespec),
+            ctypes.POINTER(_Timespec),
+        )
+        self._clock_nanosleep = clock_nanosleep
+        self._deadline = _Timespec()
+
+    def sleep_until(self, deadline: float) -> None:
+        seconds = int(deadline)
+        self._deadline.tv_sec = seconds
+        self._deadline.tv_nsec = int((deadline - seconds) * 1_000_000_000)
+        # clock_nanosleep returns an error number rather than setting errno. an interrupted sleep is restarted
+        # against the same deadline.
+        while True:
+            error = self._clock_nanosleep(
+                self._CLOCK_MONOTONIC, self._TIMER_ABSTIME, ctypes.byref(self._deadline), None
+            )
+            if error != self._EINTR:
+                break
+        if error:
+            super().sleep_until(deadline)
+
+
+def platform_sleeper() -> FrameSleeper:
+    """Returns the sleeper for the current platform and Python version, falling back to FrameSleeper when the platform
+    sleeper is not available.
+
+    Returns:
+        FrameSleeper: the sleeper for the current platform
+    """
+    if sys.version_info < (3, 11) and sys.platform == "win32":
+        try:
+            return HighResolutionTimerSleeper()
+        except (AttributeError, OSError):
+            pass
+        try:
+            return TimerResolutionSleeper()
+        except (AttributeError, OSError):
+            pass
+    if sys.version_info < (3, 11) and sys.platform.startswith("linux"):
+        try:
+            return AbsoluteMonotonicSleeper()
+        except (AttributeError, OSError):
+            pass
+    return FrameSleeper()
@@ -1,7 +1,15 @@
 """This module provides a collection of functions that generate ANSI escape codes for various terminal formatting effects.
 These escape codes can be used to modify the appearance of text in a terminal.
+
+The fixed sequences written by the Terminal are also provided as encoded bytes constants, so they can be written to a
+binary stream without being built and encoded on each write.
 """
 
+DEC_SAVE_CURSOR_POSITION_BYTES = b"\0337"
+HIDE_CURSOR_BYTES = b"\033[?25l"
+SHOW_CURSOR_BYTES = b"\033[?25h"
+END_SYNCHRONIZED_UPDATE_BYTES = b"\033[?2026l"
+
 
 def DEC_SAVE_CURSOR_POSITION() -> str:
     """Saves the cursor position using DEC sequence.
@@ -39,6 +47,24 @@ def SHOW_CURSOR() -> str:
     return "\033[?25h"
 
 
+def BEGIN_SYNCHRONIZED_UPDATE() -> str:
+    """Begins a synchronized update. Supporting terminals hold rendering until the update is ended.
+
+    Returns:
+        str: ANSI escape code
+    """
+    return "\033[?2026h"
+
+
+def END_SYNCHRONIZED_UPDATE() -> str:
+    """Ends a synchronized update, rendering all output written since the update began.
+
+    Returns:
+        str: ANSI escape code
+    """
+    return "\033[?2026l"
+
+
 def MOVE_CURSOR_UP(y: int) -> str:
     """Moves the cursor up y lines.
 
@@ -14,16 +14,16 @@ Functions:
     find_length_of_bezier_curve: Finds the length of a quadratic or cubic bezier curve.
     find_length_of_line: Finds the length of a line intersecting two coordinates.
     find_normalized_distance_from_center: Returns the normalized distance from the center of the Canvas.
+    find_normalized_distances_from_center: Returns the normalized distances from the center of the Canvas for many coordinates.
 """
 
 from __future__ import annotations
 
 import math
-from dataclasses import dataclass
+import typing
 
 
-@dataclass(eq=True, frozen=True)
-class Coord:
+class Coord(typing.NamedTuple):
     """A coordinate with row and column values.
 
     Args:
@@ -255,3 +255,29 @@ def find_normalized_distance_from_center(max_row: int, max_column: int, other_co
     distance = ((other_coord.column - center_x) ** 2 + (((other_coord.row) - center_y) * 2) ** 2) ** 0.5
 
     return distance / (max_distance / 2)
+
+
+def find_normalized_distances_from_center(
+    max_row: int, max_column: int, other_coords: typing.Iterable[Coord]
+) -> list[float]:
+    """Returns the normalized distance from the center of the Canvas for each coordinate, as floats between 0 and 1.
+
+    Equivalent to calling find_normalized_distance_from_center for each coordinate, with the center and maximum
+    distance calculated once for all coordinates.
+
+    Args:
+        max_row (int): Maximum row value of the Canvas.
+        max_column (int): Maximum column value of the Canvas.
+        other_coords (typing.Iterable[Coord]): Coordinates from which to calculate the distance.
+
+    Returns:
+        list[float]: Normalized distances from the center of the Canvas, in the order of the coordinates.
+    """
+    center_x = max_column / 2
+    center_y = max_row / 2
+    half_max_distance = (((max_column**2) + ((max_row * 2) ** 2)) ** 0.5) / 2
+
+    return [
+        (((coord.column - center_x) ** 2 + ((coord.row - center_y) * 2) ** 2) ** 0.5) / half_max_distance
+        for coord in other_coords
+    ]
@@ -9,6 +9,7 @@ Classes:
 
 from __future__ import annotations
 
+import functools
 import itertools
 import typing
 from collections.abc import Iterator
@@ -60,9 +61,10 @@ class Color:
                 "Invalid color value. Color must be an XTerm-256 color code or an RGB hex color string. Example: 255 or 'ffffff' or '#ffffff'"
             )
 
-    @property
+    @functools.cached_property
     def rgb_ints(self) -> tuple[int, int, int]:
-        """Returns the RGB values as a tuple of integers.
+        """Returns the RGB values as a tuple of integers. The hex string is parsed on first access and the result is
+        cached on the Color.
 
         Returns:
             tuple[int, int, int]: The RGB values as a tuple of integers.
@@ -269,13 +271,14 @@ class Gradient:
                 for row_value in range(max_row + 1):
                     gradient_mapping[geometry.Coord(column_value, row_value)] = color
         elif direction == Gradient.Direction.RADIAL:
-            for row_value in range(max_row + 1):
-                for column_value in range(1, max_column + 1):
-                    distance_from_center = geometry.find_normalized_distance_from_center(
-                        max_row, max_column, geometry.Coord(column_value, row_value)
-                    )
-                    color = self.get_color_at_fraction(distance_from_center)
-                    gradient_mapping[geometry.Coord(column_value, row_value)] = color
+            coords = [
+                geometry.Coord(column_value, row_value)
+                for row_value in range(max_row + 1)
+                for column_value in range(1, max_column + 1)
+            ]
+            distances = geometry.find_normalized_distances_from_center(max_row, max_column, coords)
+            for coord, distance_from_center in zip(coords, distances):
+                gradient_mapping[coord] = self.get_color_at_fraction(distance_from_center)
         elif direction == Gradient.Direction.DIAGONAL:
             for row_value in range(max_row + 1):
                 for column_value in range(1, max_column + 1):
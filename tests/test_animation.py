@@ -75,6 +75,19 @@ def test_scene_add_frame():
     assert frame.character_visual.bold is True
 
 
+def test_scene_add_frame_visuals_not_shared():
+    scene = Scene(scene_id="test_scene")
+    other_scene = Scene(scene_id="other_scene")
+    scene.add_frame(symbol="a", duration=1, color=Color("ffffff"), bold=True)
+    other_scene.add_frame(symbol="a", duration=1, color=Color("ffffff"), bold=True)
+    visual = scene.frames[0].character_visual
+    other_visual = other_scene.frames[0].character_visual
+    assert visual is not other_visual
+    visual.disable_modes()
+    assert other_visual.bold is True
+    assert other_scene.frames[0].symbol == "\x1b[1m\x1b[38;2;255;255;255ma\x1b[0m"
+
+
 def test_scene_add_frame_invalid_duration():
     scene = Scene(scene_id="test_scene")
     with pytest.raises(ValueError, match="duration must be greater than 0"):
@@ -0,0 +1,12 @@
+import pytest
+
+from terminaltexteffects.utils import geometry
+from terminaltexteffects.utils.geometry import Coord
+
+
+@pytest.mark.parametrize("max_row, max_column", [(1, 1), (5, 8), (24, 80), (7, 3)])
+def test_find_normalized_distances_from_center_matches_single(max_row, max_column):
+    # includes row and column 0 and the canvas edges
+    coords = [Coord(column, row) for row in range(max_row + 1) for column in range(max_column + 1)]
+    distances = geometry.find_normalized_distances_from_center(max_row, max_column, coords)
+    assert distances == [geometry.find_normalized_distance_from_center(max_row, max_column, coord) for coord in coords]
@@ -0,0 +1,142 @@
+import sys
+import time
+
+import pytest
+
+from terminaltexteffects.utils import _sleep
+
+
+def test_frame_sleeper_sleep_until():
+    deadline = time.perf_counter() + 0.01
+    _sleep.FrameSleeper().sleep_until(deadline)
+    assert time.perf_counter() >= deadline
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="clock_nanosleep is only used on Linux")
+def test_absolute_monotonic_sleeper_sleep_until():
+    try:
+        sleeper = _sleep.AbsoluteMonotonicSleeper()
+    except (AttributeError, OSError):
+        pytest.skip("clock_nanosleep is not available")
+    deadline = time.perf_counter() + 0.01
+    sleeper.sleep_until(deadline)
+    assert time.perf_counter() >= deadline
+    # a deadline in the past returns immediately
+    start = time.perf_counter()
+    sleeper.sleep_until(start - 1)
+    assert time.perf_counter() - start < 0.005
+
+
+def test_platform_sleeper_uses_time_sleep_from_python_3_11(monkeypatch):
+    monkeypatch.setattr(sys, "version_info", (3, 11, 0))
+    assert type(_sleep.platform_sleeper()) is _sleep.FrameSleeper
+
+
+class FakeFunction:
+    """Records calls to a stubbed Windows API function and returns a fixed result."""
+
+    def __init__(self, result):
+        self.result = result
+        self.calls: list[tuple] = []
+
+    def __call__(self, *args):
+        self.calls.append(args)
+        return self.result
+
+
+class FakeKernel32:
+    def __init__(self, handle=7, set_timer_result=True):
+        self.CreateWaitableTimerExW = FakeFunction(handle)
+        self.SetWaitableTimer = FakeFunction(set_timer_result)
+        self.WaitForSingleObject = FakeFunction(0)
+        self.CloseHandle = FakeFunction(True)
+
+
+class FakeWinmm:
+    def __init__(self, begin_result=0):
+        self.timeBeginPeriod = FakeFunction(begin_result)
+        self.timeEndPeriod = FakeFunction(0)
+
+
+@pytest.fixture
+def kernel32(monkeypatch):
+    kernel32 = FakeKernel32()
+    monkeypatch.setattr(_sleep.ctypes, "WinDLL", lambda name, use_last_error: kernel32, raising=False)
+    monkeypatch.setattr(_sleep.ctypes, "WinError", lambda code: OSError(code), raising=False)
+    monkeypatch.setattr(_sleep.ctypes, "get_last_error", lambda: 5, raising=False)
+    return kernel32
+
+
+def test_high_resolution_timer_sleeper_due_time(kernel32):
+    sleeper = _sleep.HighResolutionTimerSleeper()
+    sleeper.sleep_until(time.perf_counter() + 0.01)
+    handle, due_time, period, *_ = kernel32.SetWaitableTimer.calls[0]
+    assert handle == 7
+    assert period == 0
+    # relative due time in 100 nanosecond intervals
+    assert -100_000 <= due_time._obj.value < -90_000
+    assert kernel32.WaitForSingleObject.calls == [(7, 0xFFFFFFFF)]
+
+
+def test_high_resolution_timer_sleeper_deadline_passed(kernel32):
+    sleeper = _sleep.HighResolutionTimerSleeper()
+    sleeper.sleep_until(time.perf_counter() - 1)
+    assert kernel32.SetWaitableTimer.calls == []
+    assert kernel32.WaitForSingleObject.calls == []
+
+
+def test_high_resolution_timer_sleeper_set_timer_failed(kernel32, monkeypatch):
+    kernel32.SetWaitableTimer.result = False
+    sleeps = []
+    monkeypatch.setattr(_sleep.time, "sleep", sleeps.append)
+    _sleep.HighResolutionTimerSleeper().sleep_until(time.perf_counter() + 0.01)
+    assert kernel32.WaitForSingleObject.calls == []
+    assert len(sleeps) == 1 and 0 < sleeps[0] <= 0.01
+
+
+def test_high_resolution_timer_sleeper_close(kernel32):
+    sleeper = _sleep.HighResolutionTimerSleeper()
+    sleeper.close()
+    sleeper.close()
+    assert kernel32.CloseHandle.calls == [(7,)]
+
+
+def test_high_resolution_timer_sleeper_create_failed(kernel32):
+    kernel32.CreateWaitableTimerExW.result = None
+    with pytest.raises(OSError):
+        _sleep.HighResolutionTimerSleeper()
+
+
+@pytest.mark.parametrize("version_info", [(3, 10, 0), (3, 11, 0)])
+def test_platform_sleeper_windows(kernel32, monkeypatch, version_info):
+    monkeypatch.setattr(sys, "platform", "win32")
+    monkeypatch.setattr(sys, "version_info", version_info)
+    sleeper = _sleep.platform_sleeper()
+    if version_info < (3, 11):
+        assert isinstance(sleeper, _sleep.HighResolutionTimerSleeper)
+    else:
+        # no timer is created, time.sleep already sleeps on a high resolution timer
+        assert type(sleeper) is _sleep.FrameSleeper
+        assert kernel32.CreateWaitableTimerExW.calls == []
+
+
+@pytest.mark.parametrize("version_info", [(3, 10, 0), (3, 11, 0)])
+@pytest.mark.parametrize("begin_result", [0, 97])
+def test_platform_sleeper_windows_without_high_resolution_timers(kernel32, monkeypatch, begin_result, version_info):
+    kernel32.CreateWaitableTimerExW.result = None
+    winmm = FakeWinmm(begin_result)
+    monkeypatch.setattr(_sleep.ctypes, "windll", type("FakeWindll", (), {"winmm": winmm}), raising=False)
+    monkeypatch.setattr(sys, "platform", "win32")
+    monkeypatch.setattr(sys, "version_info", version_info)
+    sleeper = _sleep.platform_sleeper()
+    if version_info >= (3, 11):
+        assert type(sleeper) is _sleep.FrameSleeper
+        assert winmm.timeBeginPeriod.calls == []
+    elif begin_result == 0:
+        assert isinstance(sleeper, _sleep.TimerResolutionSleeper)
+        sleeper.close()
+        sleeper.close()
+        assert winmm.timeEndPeriod.calls == [(1,)]
+    else:
+        assert type(sleeper) is _sleep.FrameSleeper
+        assert winmm.timeEndPeriod.calls == []
@@ -0,0 +1,308 @@
+import io
+import sys
+import time
+
+import pytest
+
+from terminaltexteffects.engine.terminal import Terminal, TerminalConfig, _coalesce_sgr
+
+
+class RecordingBytesIO(io.BytesIO):
+    """Records each write and flush. Writes are delayed so frames queued for the output thread are still pending when
+    the test continues."""
+
+    def __init__(self):
+        super().__init__()
+        self.writes: list[bytes] = []
+        # the bytes of each write, and None for each flush, in order
+        self.events: list[bytes | None] = []
+
+    def write(self, b) -> int:
+        time.sleep(0.002)
+        self.writes.append(bytes(b))
+        self.events.append(bytes(b))
+        return super().write(b)
+
+    def flush(self) -> None:
+        self.events.append(None)
+        super().flush()
+
+    def flushed_writes(self) -> list[bytes]:
+        """Returns the bytes written between each pair of flushes, skipping flushes without writes."""
+        flushed: list[bytes] = []
+        pending = b""
+        for event in self.events:
+            if event is None:
+                if pending:
+                    flushed.append(pending)
+                pending = b""
+            else:
+                pending += event
+        return flushed
+
+
+def capture_stdout(monkeypatch) -> RecordingBytesIO:
+    # patched in the test rather than a fixture, pytest restores its own capture stream between setup and call
+    raw = RecordingBytesIO()
+    monkeypatch.setattr(sys, "stdout", io.TextIOWrapper(raw, encoding="utf-8", write_through=True))
+    return raw
+
+
+@pytest.fixture
+def terminal_config():
+    terminal_config = TerminalConfig()
+    terminal_config.ignore_terminal_dimensions = True
+    terminal_config.frame_rate = 0
+    return terminal_config
+
+
+def test_terminal_move_cursor_to_top_after_queued_frames(monkeypatch, terminal_config):
+    stdout = capture_stdout(monkeypatch)
+    terminal = Terminal("ab\ncd", terminal_config)
+    terminal.prep_canvas()
+    for frame in ("ab\ncd", "xy\nzw", "12\n34"):
+        terminal.print(frame)
+    terminal.move_cursor_to_top()
+    terminal.restore_cursor()
+    output = stdout.getvalue()
+    assert output.endswith(b"34\x1b[?2026l\x1b8\x1b[2A\x1b[?25h\n")
+
+
+@pytest.mark.parametrize("skip_unchanged_rows", [True, False])
+def test_terminal_print_skip_unchanged_rows(monkeypatch, terminal_config, skip_unchanged_rows):
+    terminal_config.skip_unchanged_rows = skip_unchanged_rows
+    stdout = capture_stdout(monkeypatch)
+    terminal = Terminal("abc\ndef\nghi", terminal_config)
+    terminal.print("abc\ndef\nghi")
+    terminal.print("abc\nxyz\nghi")
+    second_frame = stdout.writes[-1]
+    if skip_unchanged_rows:
+        assert second_frame == b"\x1b[?2026h\r\x1b[2A\nxyz\n\x1b[?2026l"
+    else:
+        assert second_frame == b"\x1b[?2026h\r\x1b[2Aabc\nxyz\nghi\x1b[?2026l"
+
+
+@pytest.mark.parametrize(
+    "output, coalesced",
+    [
+        # a reset followed by a color
+        ("\x1b[0m\x1b[38;5;1ma", "\x1b[0;38;5;1ma"),
+        # a chain of modes followed by a color
+        ("\x1b[1m\x1b[3m\x1b[5m\x1b[38;2;1;2;3ma\x1b[0m", "\x1b[1;3;5;38;2;1;2;3ma\x1b[0m"),
+        # a two digit parameter
+        ("\x1b[10m\x1b[38;5;1ma", "\x1b[10m\x1b[38;5;1ma"),
+        # literal text ending in m
+        ("am\x1b[38;5;1ma", "am\x1b[38;5;1ma"),
+        ("\x1b[0mm\x1b[38;5;1ma", "\x1b[0mm\x1b[38;5;1ma"),
+        # a CSI sequence other than SGR
+        ("\x1b[0m\x1b[2K\x1b[38;5;1ma", "\x1b[0m\x1b[2K\x1b[38;5;1ma"),
+        ("\x1b[2K\x1b[38;5;1ma", "\x1b[2K\x1b[38;5;1ma"),
+    ],
+)
+def test_coalesce_sgr(output, coalesced):
+    assert _coalesce_sgr(output) == coalesced
+
+
+END_FRAME = b"\x1b[?2026l"
+
+
+@pytest.mark.parametrize("prep_canvas", [False, True])
+def test_terminal_flush_every(monkeypatch, terminal_config, prep_canvas):
+    terminal_config.flush_every = 3
+    stdout = capture_stdout(monkeypatch)
+    terminal = Terminal("ab\ncd", terminal_config)
+    if prep_canvas:
+        terminal.prep_canvas()
+    for _ in range(7):
+        terminal.print("ab\ncd")
+    if prep_canvas:
+        terminal.restore_cursor()
+        # frames between flushes are collected and sent to stdout in a single write
+        assert len(stdout.writes) == 3
+    else:
+        terminal.flush()
+        assert len(stdout.writes) == 7
+    assert [write.count(END_FRAME) for write in stdout.flushed_writes()] == [3, 3, 1]
+
+
+@pytest.mark.parametrize("prep_canvas", [False, True])
+def test_terminal_print_frame_bytes_flush(monkeypatch, terminal_config, prep_canvas):
+    stdout = capture_stdout(monkeypatch)
+    terminal = Terminal("ab\ncd", terminal_config)
+    if prep_canvas:
+        terminal.prep_canvas()
+    terminal.print_frame_bytes(b"ab\ncd", flush=False)
+    terminal.print_frame_bytes(b"xy\nzw", flush=False)
+    terminal.flush()
+    terminal.print_frame_bytes(b"12\n34")
+    if prep_canvas:
+        terminal.restore_cursor()
+    frames = [write for write in stdout.flushed_writes() if END_FRAME in write]
+    assert [frame.count(END_FRAME) for frame in frames] == [2, 1]
+    assert frames[0].endswith(b"ab\ncd" + END_FRAME + b"\x1b[?2026h\r\x1b[1Axy\nzw" + END_FRAME)
+    assert frames[1].startswith(b"\x1b[?2026h\r\x1b[1A12\n34" + END_FRAME)
+
+
+@pytest.mark.parametrize("prep_canvas", [False, True])
+def test_terminal_print_after_print_frame_bytes(monkeypatch, terminal_config, prep_canvas):
+    stdout = capture_stdout(monkeypatch)
+    terminal = Terminal("ab\ncd", terminal_config)
+    if prep_canvas:
+        terminal.prep_canvas()
+    terminal.print("ab\ncd")
+    # a frame with more rows than the canvas leaves the cursor on its last row
+    terminal.print_frame_bytes(b"ab\ncd\nef")
+    terminal.print("xy\nzw")
+    terminal.print("12\n34")
+    if prep_canvas:
+        terminal.restore_cursor()
+    output = stdout.getvalue()
+    assert b"ef" + END_FRAME + b"\x1b[?2026h\r\x1b[2Axy\nzw" + END_FRAME in output
+    assert b"zw" + END_FRAME + b"\x1b[?2026h\r\x1b[1A12\n34" + END_FRAME in output
+
+
+@pytest.mark.parametrize("prep_canvas", [False, True])
+def test_terminal_print_after_move_cursor_to_top(monkeypatch, terminal_config, prep_canvas):
+    stdout = capture_stdout(monkeypatch)
+    terminal = Terminal("ab\ncd", terminal_config)
+    if prep_canvas:
+        terminal.prep_canvas()
+    terminal.print("ab\ncd")
+    terminal.move_cursor_to_top()
+    terminal.print("xy\nzw")
+    if prep_canvas:
+        terminal.restore_cursor()
+    output = stdout.getvalue()
+    assert (b"\x1b[?2026h\x1b[2Aab\ncd" + END_FRAME + b"\x1b8\x1b[2A" + b"\x1b[?2026h\rxy\nzw" + END_FRAME) in output
+    if not prep_canvas:
+        assert stdout.writes == [
+            b"\x1b[?2026h\x1b[2Aab\ncd" + END_FRAME,
+            b"\x1b8\x1b[2A",
+            b"\x1b[?2026h\rxy\nzw" + END_FRAME,
+        ]
+
+
+class FailingBytesIO(RecordingBytesIO):
+    """Raises on writes containing the given bytes."""
+
+    def __init__(self, fail_on: bytes):
+        super().__init__()
+        self.fail_on = fail_on
+
+    def write(self, b) -> int:
+        if self.fail_on in bytes(b):
+            raise OSError("write failed")
+        return super().write(b)
+
+
+def test_terminal_restore_cursor_raises_output_error(monkeypatch, terminal_config):
+    stdout = FailingBytesIO(b"34")
+    monkeypatch.setattr(sys, "stdout", io.TextIOWrapper(stdout, encoding="utf-8", write_through=True))
+    terminal = Terminal("ab\ncd", terminal_config)
+    terminal.prep_canvas()
+    terminal.print("ab\ncd")
+    terminal.print("12\n34")
+    with pytest.raises(OSError, match="write failed"):
+        terminal.restore_cursor()
+    # the cursor is restored before the error is raised
+    assert stdout.getvalue().endswith(b"\x1b[?25h\n")
+
+
+class FakeClock:
+    """Stands in for time.perf_counter. Each reading advances the clock by tick, so waiting on the clock ends."""
+
+    def __init__(self, now: float, tick: float = 0.0):
+        self.now = now
+        self.tick = tick
+        self.readings = 0
+
+    def __call__(self) -> float:
+        now = self.now
+        self.now += self.tick
+        self.readings += 1
+        return now
+
+
+class FakeSleeper:
+    """Records the requested wake times and advances the fake clock to them."""
+
+    def __init__(self, clock: FakeClock):
+        self.clock = clock
+        self.wakes: list[float] = []
+
+    def sleep_until(self, deadline: float) -> None:
+        self.wakes.append(deadline)
+        self.clock.now = max(self.clock.now, deadline)
+
+    def close(self) -> None:
+        pass
+
+
+@pytest.fixture
+def paced_terminal(monkeypatch, terminal_config):
+    clock = FakeClock(100.0)
+    monkeypatch.setattr(time, "perf_counter", clock)
+    terminal_config.frame_rate = 10
+    terminal = Terminal("a", terminal_config)
+    sleeper = FakeSleeper(clock)
+    terminal._frame_sleeper = sleeper
+    return terminal, clock, sleeper
+
+
+def test_terminal_enforce_framerate(paced_terminal):
+    terminal, clock, sleeper = paced_terminal
+    # on time, the frame sleeps until one frame delay after the previous deadline
+    clock.now = 100.04
+    assert terminal.enforce_framerate() is True
+    assert sleeper.wakes == [pytest.approx(100.1)]
+    assert terminal._next_frame_deadline == pytest.approx(100.1)
+    # slightly late, within _MAX_CATCH_UP_FRAMES frame delays of the deadline. the frame is not slept and the
+    # schedule is kept, so the following frames catch up on it.
+    clock.now = 100.35
+    assert terminal.enforce_framerate() is False
+    assert terminal._next_frame_deadline == pytest.approx(100.2)
+    assert terminal.enforce_framerate() is False
+    assert terminal._next_frame_deadline == pytest.approx(100.3)
+    assert terminal.enforce_framerate() is True
+    assert sleeper.wakes[1:] == [pytest.approx(100.4)]
+    # very late, the schedule is re-armed from the current time rather than catching up frame by frame
+    clock.now = 101.0
+    assert terminal.enforce_framerate() is False
+    assert terminal._next_frame_deadline == 101.0
+    assert terminal.enforce_framerate() is True
+    assert sleeper.wakes[2:] == [pytest.approx(101.1)]
+
+
+def test_terminal_enforce_framerate_spin_margin(paced_terminal):
+    terminal, clock, sleeper = paced_terminal
+    terminal._frame_spin_margin = 0.002
+    clock.tick = 0.0001
+    # the sleeper wakes the margin before the deadline and the rest is spent reading the clock
+    clock.now = 100.04
+    assert terminal.enforce_framerate() is True
+    assert sleeper.wakes == [pytest.approx(100.098)]
+    assert 100.1 <= clock.now < 100.1002
+    assert clock.readings > 10
+    # with less than the margin left, the sleeper is not used
+    clock.now = 100.199
+    readings = clock.readings
+    assert terminal.enforce_framerate() is True
+    assert len(sleeper.wakes) == 1
+    assert 100.2 <= clock.now < 100.2002
+    assert clock.readings - readings > 5
+
+
+@pytest.mark.parametrize("frame_rate", [0, -1])
+def test_terminal_enforce_framerate_unlimited(monkeypatch, terminal_config, frame_rate):
+    clock = FakeClock(100.0)
+    monkeypatch.setattr(time, "perf_counter", clock)
+    terminal_config.frame_rate = frame_rate
+    terminal = Terminal("a", terminal_config)
+    sleeper = FakeSleeper(clock)
+    terminal._frame_sleeper = sleeper
+    readings = clock.readings
+    # frames are never slept and the clock is not read
+    assert terminal.enforce_framerate() is False
+    assert terminal.enforce_framerate() is False
+    assert sleeper.wakes == []
+    assert clock.readings == readings